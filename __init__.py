@@ -10,12 +10,29 @@ bl_info = {
 
 import bpy
 import bmesh
+import contextlib
+import functools
+import hashlib
 import json
+import math
 import os
 import bpy.app.handlers
 
 from bpy.app.handlers import persistent
-from . import operators, ui
+from . import operators
+
+try:
+    import orjson
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj)
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj):
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+    _json_loads = json.loads
 from .client import PlasticityClient
 from .handler import SceneHandler
 
@@ -24,47 +41,189 @@ plasticity_client = PlasticityClient(handler)
 
 addon_name = bl_info["name"].replace(" ", "_")
 
-base_path = bpy.utils.script_path_user()
-presets_folder = os.path.join(base_path, 'presets', addon_name)
-
-if not os.path.exists(presets_folder):
-    os.makedirs(presets_folder)
-
-PRESET_FILE_PATH = os.path.join(presets_folder, 'refacet_presets.json')
+@functools.lru_cache(maxsize=1)
+def _preset_file_path():
+    presets_folder = os.path.join(bpy.utils.script_path_user(), 'presets', addon_name)
+    os.makedirs(presets_folder, exist_ok=True)
+    return os.path.join(presets_folder, 'refacet_presets.json')
+
+_PRESETS_CACHE = None
+_PRESETS_CACHE_KEY = None
+_PRESETS_LOAD_PENDING = False
+_PRESETS_LOAD_SCHEDULED = False
+_PRESETS_LOADING = False
+_PRESETS_SAVE_DIRTY = False
+_PRESETS_SAVE_SCHEDULED = False
+_PRESETS_SAVE_DELAY = 0.25
+_PRESETS_SAVE_RETRY_INTERVAL = 1.0
+_LAST_PRESETS_DIGEST = None
 
 # Save Refacet presets
 def save_presets():
-    presets = []
-    for preset in bpy.context.scene.refacet_presets:
-        preset_dict = preset.to_dict()
-        presets.append(preset_dict)
-
-    with open(PRESET_FILE_PATH, 'w') as f:
-        json.dump(presets, f)
+    global _PRESETS_CACHE, _PRESETS_CACHE_KEY, _LAST_PRESETS_DIGEST
+    scene_presets = bpy.context.scene.refacet_presets
+    presets = [_preset_to_dict(preset) for preset in scene_presets]
+    _PRESETS_CACHE = presets
+
+    data = _json_dumps(presets)
+    digest = hashlib.blake2b(data, digest_size=16).digest()
+    preset_file_path = _preset_file_path()
+    # Only skip the write when the file on disk is still the one last read or
+    # written; a deleted or externally replaced file must be written back.
+    if digest == _LAST_PRESETS_DIGEST:
+        file_key = _presets_file_key(preset_file_path)
+        if file_key is not None and file_key == _PRESETS_CACHE_KEY:
+            return
+
+    # Write to a temporary file first so a crash mid-write cannot leave a
+    # truncated preset file behind.
+    tmp_path = preset_file_path + ".tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, preset_file_path)
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    _LAST_PRESETS_DIGEST = digest
+    _PRESETS_CACHE_KEY = _presets_file_key(preset_file_path)
+
+def _flush_presets():
+    global _PRESETS_SAVE_DIRTY, _PRESETS_SAVE_SCHEDULED
+    _PRESETS_SAVE_SCHEDULED = False
+    if not _PRESETS_SAVE_DIRTY:
+        return None
+    try:
+        save_presets()
+    except Exception as exc:
+        print(f"Plasticity: failed to save refacet presets: {exc}")
+        # Keep the edits dirty and have the timer try again.
+        if bpy.app.timers.is_registered(_flush_presets):
+            _PRESETS_SAVE_SCHEDULED = True
+            return _PRESETS_SAVE_RETRY_INTERVAL
+        return None
+    _PRESETS_SAVE_DIRTY = False
+    return None
 
-# Load refacet presets
-@persistent
-def load_presets(dummy):
-    scene = bpy.context.scene
-    if scene is None:
+def _schedule_save():
+    global _PRESETS_SAVE_DIRTY, _PRESETS_SAVE_SCHEDULED
+    _PRESETS_SAVE_DIRTY = True
+    if _PRESETS_SAVE_SCHEDULED and bpy.app.timers.is_registered(_flush_presets):
         return
+    _PRESETS_SAVE_SCHEDULED = True
+    # Persistent so opening another file before it fires does not drop the save.
+    bpy.app.timers.register(
+        _flush_presets, first_interval=_PRESETS_SAVE_DELAY, persistent=True
+    )
 
-    # Clear existing presets
-    scene.refacet_presets.clear()
+def _presets_file_key(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+def _read_presets_file():
+    global _PRESETS_CACHE, _PRESETS_CACHE_KEY, _LAST_PRESETS_DIGEST
+    preset_file_path = _preset_file_path()
+    key = _presets_file_key(preset_file_path)
+    if _PRESETS_CACHE is not None and key == _PRESETS_CACHE_KEY:
+        return _PRESETS_CACHE
 
-    if os.path.exists(PRESET_FILE_PATH):
+    presets = []
+    if key is not None:
         try:
-            with open(PRESET_FILE_PATH, 'r') as f:
-                presets = json.load(f)
+            with open(preset_file_path, 'rb') as f:
+                data = f.read()
+            presets = _json_loads(data)
+            # Saving the content that was just read back should not rewrite it.
+            _LAST_PRESETS_DIGEST = hashlib.blake2b(data, digest_size=16).digest()
         except Exception:
             presets = []
+    _PRESETS_CACHE = presets
+    _PRESETS_CACHE_KEY = key
+    return presets
+
+def _materialize_presets():
+    global _PRESETS_LOAD_PENDING, _PRESETS_LOADING
+    _PRESETS_LOAD_PENDING = False
+    scene = getattr(bpy.context, "scene", None)
+    if scene is None:
+        return
+
+    presets = _read_presets_file()
+    scene_presets = scene.refacet_presets
+    # The collection is saved with the .blend file, so it often already
+    # holds exactly what is on disk. Compare serialized content before
+    # rebuilding it.
+    if _LAST_PRESETS_DIGEST is not None and len(scene_presets) == len(presets):
+        data = _json_dumps([_preset_to_dict(preset) for preset in scene_presets])
+        if hashlib.blake2b(data, digest_size=16).digest() == _LAST_PRESETS_DIGEST:
+            return
+
+    # Clear existing presets
+    scene_presets.clear()
 
+    # Property updates fired while filling the collection must not schedule
+    # a save of the data that was just read.
+    _PRESETS_LOADING = True
+    add = scene_presets.add
+    try:
         for preset_dict in presets:
             try:
-                preset = scene.refacet_presets.add()
+                preset = add()
                 preset.from_dict(preset_dict)
             except Exception:
                 continue
+    finally:
+        _PRESETS_LOADING = False
+
+def _ensure_presets_loaded():
+    if not _PRESETS_LOAD_PENDING:
+        return
+    try:
+        _materialize_presets()
+    except AttributeError:
+        # ID writes are not allowed while drawing; let the load timer fill
+        # the collection instead.
+        _schedule_presets_load()
+
+def _run_presets_load_timer():
+    global _PRESETS_LOAD_SCHEDULED, _PRESETS_LOAD_PENDING
+    _PRESETS_LOAD_SCHEDULED = False
+    if _PRESETS_LOAD_PENDING:
+        try:
+            _materialize_presets()
+        except Exception as exc:
+            # Leave the load pending so the _ensure_presets_loaded() guards retry it.
+            _PRESETS_LOAD_PENDING = True
+            print(f"Plasticity: failed to load refacet presets: {exc}")
+    return None
+
+def _schedule_presets_load():
+    global _PRESETS_LOAD_PENDING, _PRESETS_LOAD_SCHEDULED
+    _PRESETS_LOAD_PENDING = True
+    if _PRESETS_LOAD_SCHEDULED and bpy.app.timers.is_registered(_run_presets_load_timer):
+        return
+    _PRESETS_LOAD_SCHEDULED = True
+    # Persistent so loading another file before it fires does not drop it.
+    bpy.app.timers.register(_run_presets_load_timer, first_interval=0.0, persistent=True)
+
+# Load refacet presets
+@persistent
+def load_presets(dummy):
+    scene = bpy.context.scene
+    if scene is None:
+        return
+
+    # The preset collection is filled from a timer so file loading does not
+    # wait on reading and parsing the preset file.
+    _schedule_presets_load()
 
     # Keep runtime behavior in sync with persisted scene toggles, even when
     # there is no preset file.
@@ -85,10 +244,14 @@ def _bootstrap_pivot_runtime(scene=None):
         pass
 
 def update_and_save_preset(self, context):
-    save_presets()
+    if _PRESETS_LOADING:
+        return
+    _schedule_save()
 
 def update_name(self, context):
-    save_presets()
+    if _PRESETS_LOADING:
+        return
+    _schedule_save()
 
 def _density_to_plane_tolerance(density):
     return max(0.0001, 0.01 * (1.0 - density))
@@ -96,40 +259,43 @@ def _density_to_plane_tolerance(density):
 def _density_to_angle_tolerance(density):
     return max(0.10, 0.45 - 0.35 * density)
 
-def _set_attr_if_changed(obj, attr, value, eps=1e-9):
-    current = getattr(obj, attr, None)
-    if current is None:
-        setattr(obj, attr, value)
-        return True
-    if isinstance(current, float) and abs(current - value) <= eps:
-        return False
-    if current == value:
+def _set_float_if_changed(obj, attr, value, eps=1e-9):
+    if math.fabs(getattr(obj, attr) - value) <= eps:
         return False
     setattr(obj, attr, value)
     return True
 
 def update_density_preset(self, context):
+    # Loaded presets carry their own tolerances; do not derive them from density.
+    if _PRESETS_LOADING:
+        return
     density = max(0.01, min(1.0, float(self.density)))
     plane_tol = _density_to_plane_tolerance(density)
     angle_tol = _density_to_angle_tolerance(density)
-    _set_attr_if_changed(self, "tolerance", plane_tol)
-    _set_attr_if_changed(self, "angle", angle_tol)
-    _set_attr_if_changed(self, "Edge_chord_tolerance", plane_tol)
-    _set_attr_if_changed(self, "Face_plane_tolerance", plane_tol)
-    _set_attr_if_changed(self, "Edge_Angle_tolerance", angle_tol)
-    _set_attr_if_changed(self, "Face_Angle_tolerance", angle_tol)
-    save_presets()
+    for attr, value in (
+        ("tolerance", plane_tol),
+        ("angle", angle_tol),
+        ("Edge_chord_tolerance", plane_tol),
+        ("Face_plane_tolerance", plane_tol),
+        ("Edge_Angle_tolerance", angle_tol),
+        ("Face_Angle_tolerance", angle_tol),
+    ):
+        _set_float_if_changed(self, attr, value)
+    _schedule_save()
 
 def update_density_scene(self, context):
     density = max(0.01, min(1.0, float(self.prop_plasticity_facet_density)))
     plane_tol = _density_to_plane_tolerance(density)
     angle_tol = _density_to_angle_tolerance(density)
-    _set_attr_if_changed(self, "prop_plasticity_facet_tolerance", plane_tol)
-    _set_attr_if_changed(self, "prop_plasticity_facet_angle", angle_tol)
-    _set_attr_if_changed(self, "prop_plasticity_curve_chord_tolerance", plane_tol)
-    _set_attr_if_changed(self, "prop_plasticity_surface_plane_tolerance", plane_tol)
-    _set_attr_if_changed(self, "prop_plasticity_curve_angle_tolerance", angle_tol)
-    _set_attr_if_changed(self, "prop_plasticity_surface_angle_tolerance", angle_tol)
+    for attr, value in (
+        ("prop_plasticity_facet_tolerance", plane_tol),
+        ("prop_plasticity_facet_angle", angle_tol),
+        ("prop_plasticity_curve_chord_tolerance", plane_tol),
+        ("prop_plasticity_surface_plane_tolerance", plane_tol),
+        ("prop_plasticity_curve_angle_tolerance", angle_tol),
+        ("prop_plasticity_surface_angle_tolerance", angle_tol),
+    ):
+        _set_float_if_changed(self, attr, value)
 
 
 LIVE_EXPAND_CIRCLE_RADIUS = 5
@@ -145,20 +311,20 @@ _CHECKER_INIT_SCHEDULED = False
 def update_live_expand(self, context):
     if context.scene.prop_plasticity_live_expand:
         operators.ensure_live_expand_timer()
-        if getattr(context.scene, "prop_plasticity_live_expand_edge_highlight", False):
+        if context.scene.prop_plasticity_live_expand_edge_highlight:
             operators.ensure_live_expand_overlay()
         operators.set_live_expand_active_view(context)
-        if getattr(context.scene, "prop_plasticity_live_expand_auto_circle", False):
-            if context is not None and getattr(context, "mode", None) == 'EDIT_MESH':
+        if context.scene.prop_plasticity_live_expand_auto_circle:
+            if context is not None and context.mode == 'EDIT_MESH':
                 _set_view3d_tool("builtin.select_circle", circle_radius=LIVE_EXPAND_CIRCLE_RADIUS)
             else:
                 _set_view3d_tool("builtin.select_box")
     else:
-        if getattr(context.scene, "prop_plasticity_live_expand_auto_circle", False):
+        if context.scene.prop_plasticity_live_expand_auto_circle:
             _set_view3d_tool("builtin.select_box")
-        if not getattr(context.scene, "prop_plasticity_live_expand_auto_merge_seams", False):
+        if not context.scene.prop_plasticity_live_expand_auto_merge_seams:
             operators.stop_live_expand_timer()
-        if not getattr(context.scene, "prop_plasticity_live_expand_edge_highlight", False):
+        if not context.scene.prop_plasticity_live_expand_edge_highlight:
             operators.stop_live_expand_overlay()
 
 
@@ -166,9 +332,7 @@ def update_live_expand_auto_merge_seams(self, context):
     scene = getattr(context, "scene", None) if context else None
     if scene is None:
         return
-    if getattr(scene, "prop_plasticity_live_expand", False) or getattr(
-        scene, "prop_plasticity_live_expand_auto_merge_seams", False
-    ):
+    if scene.prop_plasticity_live_expand or scene.prop_plasticity_live_expand_auto_merge_seams:
         operators.ensure_live_expand_timer()
     else:
         operators.stop_live_expand_timer()
@@ -199,7 +363,7 @@ def update_live_paint_faces(self, context):
     scene = getattr(context, "scene", None)
     if scene is None:
         return
-    if getattr(scene, "prop_plasticity_live_paint_faces", False):
+    if scene.prop_plasticity_live_paint_faces:
         operators.ensure_live_paint_faces_timer()
     else:
         operators.stop_live_paint_faces_timer()
@@ -209,7 +373,7 @@ def update_live_paint_faces_settings(self, context):
     scene = getattr(context, "scene", None) if context else None
     if scene is None:
         return
-    if getattr(scene, "prop_plasticity_live_paint_faces", False):
+    if scene.prop_plasticity_live_paint_faces:
         operators.apply_live_paint_faces(scene=scene, force=True)
 
 
@@ -271,11 +435,12 @@ def _schedule_live_expand_sync(retries=20):
 
 def _on_mode_change(scene, depsgraph):
     global _LAST_CONTEXT_MODE, _MODE_CHANGE_RESET_TOKEN
-    context = bpy.context
-    mode = getattr(context, "mode", None)
+    # Runs on every depsgraph update; keep the unchanged-mode path minimal.
+    mode = bpy.context.mode
     prev_mode = _LAST_CONTEXT_MODE
     if mode == prev_mode:
         return
+    context = bpy.context
     _LAST_CONTEXT_MODE = mode
     _MODE_CHANGE_RESET_TOKEN += 1
     token = _MODE_CHANGE_RESET_TOKEN
@@ -325,7 +490,7 @@ def update_object_transform_control_mode(self, context):
     scene = getattr(context, "scene", None) if context else getattr(bpy.context, "scene", None)
     if scene is None:
         return
-    if getattr(scene, "prop_plasticity_object_transform_control_mode", "PLASTICITY") == "BLENDER":
+    if scene.prop_plasticity_object_transform_control_mode == "BLENDER":
         try:
             handler.capture_current_transform_control_state(scene)
         except Exception:
@@ -491,7 +656,7 @@ def update_live_refacet_only_selected(self, context):
     scene = getattr(context, "scene", None) if context else None
     if scene is None:
         return
-    if not getattr(scene, "prop_plasticity_live_refacet", False):
+    if not scene.prop_plasticity_live_refacet:
         return
     operators.stop_live_refacet_timer()
     operators.ensure_live_refacet_timer()
@@ -514,28 +679,72 @@ def update_util_paint_faces(self, context):
 def update_util_highlight(self, context):
     return
 
+# (window index, area index) of the last VIEW_3D area a tool was set in.
+# Indices are cached instead of the RNA structs, which can be freed when
+# screens change.
+_VIEW3D_TOOL_TARGET = None
+
+def _view3d_window_region(area):
+    for region in area.regions:
+        if region.type == 'WINDOW':
+            return region
+    return None
+
+def _view3d_target_at(window_manager, target):
+    window_index, area_index = target
+    windows = window_manager.windows
+    if window_index >= len(windows):
+        return None
+    window = windows[window_index]
+    screen = window.screen
+    if screen is None:
+        return None
+    areas = screen.areas
+    if area_index >= len(areas):
+        return None
+    area = areas[area_index]
+    if area.type != 'VIEW_3D':
+        return None
+    region = _view3d_window_region(area)
+    if region is None:
+        return None
+    return window, area, region
+
+def _apply_view3d_tool(window, area, region, tool_id, circle_radius):
+    try:
+        with bpy.context.temp_override(window=window, area=area, region=region):
+            bpy.ops.wm.tool_set_by_id(name=tool_id)
+            if circle_radius is not None and tool_id == "builtin.select_circle":
+                _set_circle_radius(circle_radius)
+        return True
+    except Exception:
+        return False
+
 def _set_view3d_tool(tool_id, circle_radius=None):
+    global _VIEW3D_TOOL_TARGET
     window_manager = bpy.context.window_manager
     if window_manager is None:
         return False
-    for window in window_manager.windows:
+
+    if _VIEW3D_TOOL_TARGET is not None:
+        target = _view3d_target_at(window_manager, _VIEW3D_TOOL_TARGET)
+        if target is not None and _apply_view3d_tool(*target, tool_id, circle_radius):
+            return True
+        _VIEW3D_TOOL_TARGET = None
+
+    for window_index, window in enumerate(window_manager.windows):
         screen = window.screen
         if screen is None:
             continue
-        for area in screen.areas:
+        for area_index, area in enumerate(screen.areas):
             if area.type != 'VIEW_3D':
                 continue
-            region = next((r for r in area.regions if r.type == 'WINDOW'), None)
+            region = _view3d_window_region(area)
             if region is None:
                 continue
-            try:
-                with bpy.context.temp_override(window=window, area=area, region=region):
-                    bpy.ops.wm.tool_set_by_id(name=tool_id)
-                    if circle_radius is not None and tool_id == "builtin.select_circle":
-                        _set_circle_radius(circle_radius)
+            if _apply_view3d_tool(window, area, region, tool_id, circle_radius):
+                _VIEW3D_TOOL_TARGET = (window_index, area_index)
                 return True
-            except Exception:
-                continue
     return False
 
 
@@ -558,12 +767,41 @@ def _set_circle_radius(radius):
 # Custom UIList to catch the event of renaming a member of the list. Looks like it's not natively supported by the API (necessary in order to save the Refacet presets whenever an entry is renamed by double clicking on an entry and renaming it).
 class OBJECT_UL_RefacetPresetsList(bpy.types.UIList):
     def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
-        if self.layout_type in {'DEFAULT', 'COMPACT'}:
+        layout_type = self.layout_type
+        if layout_type == 'DEFAULT' or layout_type == 'COMPACT':
             layout.prop(item, "name", text="", emboss=False, icon_value=icon)
-        elif self.layout_type in {'GRID'}:
+        elif layout_type == 'GRID':
             layout.alignment = 'CENTER'
             layout.label(text="", icon_value=icon)
 
+# Serialized preset fields, in declaration order. density comes before the
+# tolerances so its update callback does not overwrite loaded values.
+_PRESET_FIELD_TYPES = {
+    "name": str,
+    "density": float,
+    "tolerance": float,
+    "angle": float,
+    "facet_tri_or_ngon": str,
+    "min_width": float,
+    "min_width_enabled": bool,
+    "max_width": float,
+    "max_width_enabled": bool,
+    "Edge_chord_tolerance": float,
+    "Edge_Angle_tolerance": float,
+    "Face_plane_tolerance": float,
+    "Face_Angle_tolerance": float,
+    "plane_angle": float,
+    "convex_ngons_only": bool,
+    "curve_max_length_enabled": bool,
+    "curve_max_length": float,
+    "relative_to_bbox": bool,
+    "match_topology": bool,
+}
+_PRESET_ATTRS = tuple(_PRESET_FIELD_TYPES)
+
+def _preset_to_dict(preset):
+    return {attr: getattr(preset, attr) for attr in _PRESET_ATTRS}
+
 # Refacet Preset Class
 class RefacetPreset(bpy.types.PropertyGroup):
     name: bpy.props.StringProperty(name="Name", default="New Preset", update=update_name)
@@ -650,13 +888,17 @@ class RefacetPreset(bpy.types.PropertyGroup):
     )
 
     def to_dict(self):
-        return {attr: getattr(self, attr) for attr in dir(self)
-                if not callable(getattr(self, attr))
-                and not attr.startswith("__")
-                and isinstance(getattr(self, attr), (int, float, str))}
+        return _preset_to_dict(self)
 
     def from_dict(self, preset_dict):
-        for attr, value in preset_dict.items():
+        for attr, field_type in _PRESET_FIELD_TYPES.items():
+            value = preset_dict.get(attr)
+            if value is None:
+                continue
+            try:
+                value = field_type(value)
+            except (TypeError, ValueError):
+                continue
             setattr(self, attr, value)
 
 class AddRefacetPresetOperator(bpy.types.Operator):
@@ -665,6 +907,7 @@ class AddRefacetPresetOperator(bpy.types.Operator):
     bl_description = "Create a new refacet preset and save it to disk"
 
     def execute(self, context):
+        _ensure_presets_loaded()
         preset = context.scene.refacet_presets.add()
         preset.name = "New Preset"
         save_presets()
@@ -676,78 +919,97 @@ class RemoveRefacetPresetOperator(bpy.types.Operator):
     bl_description = "Delete the active refacet preset and save changes (destructive)"
 
     def execute(self, context):
+        _ensure_presets_loaded()
         index = context.scene.active_refacet_preset_index
         context.scene.refacet_presets.remove(index)
         save_presets()
 
-        if len(context.scene.refacet_presets) > 0:
-            context.scene.active_refacet_preset_index = min(max(0, index - 1), len(context.scene.refacet_presets) - 1)
-        else:
-            context.scene.active_refacet_preset_index = -1
+        # The removed index was valid, so index - 1 is always below the new count.
+        count = len(context.scene.refacet_presets)
+        context.scene.active_refacet_preset_index = (index - 1 if index > 0 else 0) if count else -1
 
         return {'FINISHED'}
 
+_SELECT_BY_FACE_ID_IDNAME = operators.SelectByFaceIDOperator.bl_idname
+
 def select_similar(self, context):
-    self.layout.operator(operators.SelectByFaceIDOperator.bl_idname)
+    self.layout.operator(_SELECT_BY_FACE_ID_IDNAME)
+
+# ui reads plasticity_client and load_presets from this module at import
+# time, so it can only be imported once they are defined.
+from . import ui
+
+_classes = (
+    ui.ConnectButton,
+    ui.DisconnectButton,
+    ui.ListButton,
+    ui.SendToPlasticityButton,
+    ui.SubscribeAllButton,
+    ui.UnsubscribeAllButton,
+    ui.RefacetButton,
+    RefacetPreset,
+    AddRefacetPresetOperator,
+    RemoveRefacetPresetOperator,
+    ui.PlasticityPanel,
+    operators.SelectByFaceIDOperator,
+    operators.SelectByFaceIDEdgeOperator,
+    operators.AutoMarkEdgesOperator,
+    operators.MergeUVSeams,
+    operators.RelaxUVsPlasticityOperator,
+    operators.AutoUnwrapPlasticityOperator,
+    operators.PackUVIslandsPlasticityOperator,
+    operators.PaintPlasticityFacesOperator,
+    operators.CapturePlasticityFaceMaterialMappingOperator,
+    operators.ReapplyPlasticityFaceMaterialMappingOperator,
+    operators.ClearPlasticityFaceMaterialMappingOperator,
+    operators.SimilarGeometrySelector,
+    operators.SelectedJoiner,
+    operators.SelectedUnjoiner,
+    operators.NonOverlappingMeshesMerger,
+    operators.OpenUVEditorOperator,
+    operators.CloseUVEditorOperator,
+    operators.MaterialRemover,
+    operators.AssignUVCheckerTextureOperator,
+    operators.SelectCheckerImageOperator,
+    operators.RemoveUVCheckerNodesOperator,
+    operators.TextureReloader,
+    operators.ImportFBXOperator,
+    operators.ExportFBXOperator,
+    operators.ImportOBJOperator,
+    operators.ExportOBJOperator,
+    operators.MirrorOperator,
+    operators.RemoveModifiers,
+    operators.ApplyModifiers,
+    operators.RemoveVertexGroups,
+    operators.SnapToCursorOperator,
+    operators.SelectMeshesWithNgons,
+    operators.SelectObjectsWithoutUVs,
+    operators.RemoveUVsFromSelectedObjects,
+    OBJECT_UL_RefacetPresetsList,
+)
 
-def register():
-    print("Registering Plasticity client")
-    bpy.utils.register_class(ui.ConnectButton)
-    bpy.utils.register_class(ui.DisconnectButton)
-    bpy.utils.register_class(ui.ListButton)
-    bpy.utils.register_class(ui.SendToPlasticityButton)
-    bpy.utils.register_class(ui.SubscribeAllButton)
-    bpy.utils.register_class(ui.UnsubscribeAllButton)
-    bpy.utils.register_class(ui.RefacetButton)
-
-    bpy.utils.register_class(RefacetPreset)
-    bpy.types.Scene.refacet_presets = bpy.props.CollectionProperty(type=RefacetPreset)
-    bpy.types.Scene.active_refacet_preset_index = bpy.props.IntProperty(name="Active Preset", default=0)
-    bpy.utils.register_class(AddRefacetPresetOperator)
-    bpy.utils.register_class(RemoveRefacetPresetOperator)
-
-    bpy.utils.register_class(ui.PlasticityPanel)
-    bpy.utils.register_class(operators.SelectByFaceIDOperator)
-    bpy.utils.register_class(operators.SelectByFaceIDEdgeOperator)
-    bpy.utils.register_class(operators.AutoMarkEdgesOperator)
-    bpy.utils.register_class(operators.MergeUVSeams)
-    bpy.utils.register_class(operators.RelaxUVsPlasticityOperator)
-    bpy.utils.register_class(operators.AutoUnwrapPlasticityOperator)
-    bpy.utils.register_class(operators.PackUVIslandsPlasticityOperator)
-    bpy.utils.register_class(operators.PaintPlasticityFacesOperator)
-    bpy.utils.register_class(operators.CapturePlasticityFaceMaterialMappingOperator)
-    bpy.utils.register_class(operators.ReapplyPlasticityFaceMaterialMappingOperator)
-    bpy.utils.register_class(operators.ClearPlasticityFaceMaterialMappingOperator)
-    bpy.utils.register_class(operators.SimilarGeometrySelector)
-    bpy.utils.register_class(operators.SelectedJoiner)
-    bpy.utils.register_class(operators.SelectedUnjoiner)
-    bpy.utils.register_class(operators.NonOverlappingMeshesMerger)
-    bpy.utils.register_class(operators.OpenUVEditorOperator)
-    bpy.utils.register_class(operators.CloseUVEditorOperator)
-    bpy.utils.register_class(operators.MaterialRemover)
-    bpy.utils.register_class(operators.AssignUVCheckerTextureOperator)
-    bpy.utils.register_class(operators.SelectCheckerImageOperator)
-    bpy.utils.register_class(operators.RemoveUVCheckerNodesOperator)
-    bpy.utils.register_class(operators.TextureReloader)
-    bpy.utils.register_class(operators.ImportFBXOperator)
-    bpy.utils.register_class(operators.ExportFBXOperator)
-    bpy.utils.register_class(operators.ImportOBJOperator)
-    bpy.utils.register_class(operators.ExportOBJOperator)
-    bpy.utils.register_class(operators.MirrorOperator)
-    bpy.utils.register_class(operators.RemoveModifiers)
-    bpy.utils.register_class(operators.ApplyModifiers)
-    bpy.utils.register_class(operators.RemoveVertexGroups)
-    bpy.utils.register_class(operators.SnapToCursorOperator)
-    bpy.utils.register_class(operators.SelectMeshesWithNgons)
-    bpy.utils.register_class(operators.SelectObjectsWithoutUVs)
-    bpy.utils.register_class(operators.RemoveUVsFromSelectedObjects)
+_register_classes, _unregister_classes_strict = bpy.utils.register_classes_factory(_classes)
 
-    bpy.types.VIEW3D_MT_edit_mesh_select_similar.append(select_similar)
+def _unregister_classes():
+    try:
+        _unregister_classes_strict()
+        return
+    except RuntimeError:
+        pass
+    # Keep going past classes that failed to register so a partial
+    # registration can still be torn down.
+    unregister_class = bpy.utils.unregister_class
+    for cls in reversed(_classes):
+        try:
+            unregister_class(cls)
+        except RuntimeError:
+            pass
 
-    bpy.types.Scene.prop_plasticity_server = bpy.props.StringProperty(name="Server", default="localhost:8980")
-    bpy.types.Scene.prop_plasticity_facet_tolerance = bpy.props.FloatProperty(name="Tolerance", default=0.01, min=0.0001, max=0.1, step=0.001, precision=6)
-    bpy.types.Scene.prop_plasticity_facet_angle = bpy.props.FloatProperty(name="Angle", default=0.45, min=0.1, max=1.0)
-    bpy.types.Scene.prop_plasticity_facet_density = bpy.props.FloatProperty(
+_SCENE_PROPS = (
+    ("prop_plasticity_server", bpy.props.StringProperty(name="Server", default="localhost:8980")),
+    ("prop_plasticity_facet_tolerance", bpy.props.FloatProperty(name="Tolerance", default=0.01, min=0.0001, max=0.1, step=0.001, precision=6)),
+    ("prop_plasticity_facet_angle", bpy.props.FloatProperty(name="Angle", default=0.45, min=0.1, max=1.0)),
+    ("prop_plasticity_facet_density", bpy.props.FloatProperty(
         name="Density",
         default=0.01,
         min=0.01,
@@ -756,27 +1018,27 @@ def register():
         precision=2,
         subtype='FACTOR',
         update=update_density_scene,
-    )
-    bpy.types.Scene.prop_plasticity_list_only_visible = bpy.props.BoolProperty(name="List only visible", default=False)
-    bpy.types.Scene.prop_plasticity_list_only_selected = bpy.props.BoolProperty(name="List only selected", default=False)
-    bpy.types.Scene.prop_plasticity_list_only_new = bpy.props.BoolProperty(name="List only new", default=False)
-    bpy.types.Scene.prop_plasticity_send_create_subd = bpy.props.BoolProperty(
+    )),
+    ("prop_plasticity_list_only_visible", bpy.props.BoolProperty(name="List only visible", default=False)),
+    ("prop_plasticity_list_only_selected", bpy.props.BoolProperty(name="List only selected", default=False)),
+    ("prop_plasticity_list_only_new", bpy.props.BoolProperty(name="List only new", default=False)),
+    ("prop_plasticity_send_create_subd", bpy.props.BoolProperty(
         name="Auto-Create Sub D modifier",
         default=True,
-    )
-    bpy.types.Scene.prop_plasticity_send_rounded_corners = bpy.props.BoolProperty(
+    )),
+    ("prop_plasticity_send_rounded_corners", bpy.props.BoolProperty(
         name="Rounded corners",
         default=False,
-    )
-    bpy.types.Scene.prop_plasticity_send_merge_patches = bpy.props.BoolProperty(
+    )),
+    ("prop_plasticity_send_merge_patches", bpy.props.BoolProperty(
         name="Merge patches",
         default=True,
-    )
-    bpy.types.Scene.prop_plasticity_send_interpolate_boundary = bpy.props.BoolProperty(
+    )),
+    ("prop_plasticity_send_interpolate_boundary", bpy.props.BoolProperty(
         name="Interpolate boundary exactly",
         default=False,
-    )
-    bpy.types.Scene.prop_plasticity_facet_tri_or_ngon = bpy.props.EnumProperty(
+    )),
+    ("prop_plasticity_facet_tri_or_ngon", bpy.props.EnumProperty(
         items=[
             ("TRI", "Tri", "Triangles only"),
             ("QUAD", "Quad", "Limit to 4 sides; may still output triangles"),
@@ -784,20 +1046,20 @@ def register():
         ],
         name="Facet Type",
         default="TRI",
-    )
-    bpy.types.Scene.prop_plasticity_select_adjacent_fillets = bpy.props.BoolProperty(
+    )),
+    ("prop_plasticity_select_adjacent_fillets", bpy.props.BoolProperty(
         name="Select Adjacent Fillets",
         description="Also select adjacent Plasticity groups that look like fillets",
         default=False,
-    )
-    bpy.types.Scene.prop_plasticity_select_fillet_min_curvature_angle = bpy.props.FloatProperty(
+    )),
+    ("prop_plasticity_select_fillet_min_curvature_angle", bpy.props.FloatProperty(
         name="Min Curvature Angle",
         description="Minimum normal deviation (degrees) to treat a group as curved",
         default=5.0,
         min=0.0,
         max=90.0,
-    )
-    bpy.types.Scene.prop_plasticity_select_fillet_max_area_ratio = bpy.props.FloatProperty(
+    )),
+    ("prop_plasticity_select_fillet_max_area_ratio", bpy.props.FloatProperty(
         name="Max Area Ratio",
         description="Maximum fillet area relative to its largest adjacent group",
         default=0.06,
@@ -807,20 +1069,20 @@ def register():
         step=0.001,
         precision=4,
         subtype='FACTOR',
-    )
-    bpy.types.Scene.prop_plasticity_select_fillet_min_adjacent_groups = bpy.props.IntProperty(
+    )),
+    ("prop_plasticity_select_fillet_min_adjacent_groups", bpy.props.IntProperty(
         name="Min Adjacent Groups",
         description="Minimum adjacent group count for a fillet candidate",
         default=2,
         min=1,
         max=8,
-    )
-    bpy.types.Scene.prop_plasticity_select_include_vertex_adjacency = bpy.props.BoolProperty(
+    )),
+    ("prop_plasticity_select_include_vertex_adjacency", bpy.props.BoolProperty(
         name="Include Vertex Adjacent",
         description="Also consider Plasticity groups that only touch at a vertex",
         default=False,
-    )
-    bpy.types.Scene.prop_plasticity_select_vertex_adjacent_max_length_ratio = bpy.props.FloatProperty(
+    )),
+    ("prop_plasticity_select_vertex_adjacent_max_length_ratio", bpy.props.FloatProperty(
         name="Max Vertex Adjacent Length Ratio",
         description="Limit vertex-adjacent fillet selection by relative size (1.0 disables)",
         default=0.5,
@@ -828,25 +1090,25 @@ def register():
         max=10.0,
         step=0.01,
         precision=2,
-    )
-    bpy.types.Scene.prop_plasticity_live_expand = bpy.props.BoolProperty(
+    )),
+    ("prop_plasticity_live_expand", bpy.props.BoolProperty(
         name="Live Expand",
         description="Automatically expand selected triangles to Plasticity surfaces. Hold Ctrl while selecting to unselect surfaces",
         default=False,
         update=update_live_expand,
-    )
-    bpy.types.Scene.prop_plasticity_live_expand_auto_circle = bpy.props.BoolProperty(
+    )),
+    ("prop_plasticity_live_expand_auto_circle", bpy.props.BoolProperty(
         name="Auto Circle Select Mode",
         description="Switch to Circle Select when Live Expand is enabled. Hold Ctrl while selecting to unselect surfaces",
         default=True,
         update=update_live_expand_auto_circle,
-    )
-    bpy.types.Scene.prop_plasticity_live_expand_auto_select_cylinders = bpy.props.BoolProperty(
+    )),
+    ("prop_plasticity_live_expand_auto_select_cylinders", bpy.props.BoolProperty(
         name="Auto Select Cylinders (Experimental)",
         description="Expand selection to connected cylindrical side surfaces. Automatically excludes caps and fillets.",
         default=False,
-    )
-    bpy.types.Scene.prop_plasticity_live_expand_cylinder_min_wrap_angle = bpy.props.FloatProperty(
+    )),
+    ("prop_plasticity_live_expand_cylinder_min_wrap_angle", bpy.props.FloatProperty(
         name="Cylinder Min Wrap Angle",
         description="Minimum wrap angle (degrees) for auto cylinder selection",
         default=120.0,
@@ -854,19 +1116,19 @@ def register():
         max=360.0,
         step=1.0,
         precision=1,
-    )
-    bpy.types.Scene.prop_plasticity_live_expand_edge_highlight = bpy.props.BoolProperty(
+    )),
+    ("prop_plasticity_live_expand_edge_highlight", bpy.props.BoolProperty(
         name="Plasticity Edge Highlight",
         description="Draw Plasticity edge highlights using the overlay color",
         default=False,
         update=update_live_expand_edge_highlight,
-    )
-    bpy.types.Scene.prop_plasticity_live_expand_active_view_only = bpy.props.BoolProperty(
+    )),
+    ("prop_plasticity_live_expand_active_view_only", bpy.props.BoolProperty(
         name="Active View Only",
         description="Draw Plasticity edge highlights only in the active 3D view",
         default=False,
-    )
-    bpy.types.Scene.prop_plasticity_live_expand_interval = bpy.props.FloatProperty(
+    )),
+    ("prop_plasticity_live_expand_interval", bpy.props.FloatProperty(
         name="Live Expand Interval",
         description="Seconds between Live Expand updates",
         default=0.1,
@@ -875,8 +1137,8 @@ def register():
         step=0.01,
         precision=2,
         subtype='TIME',
-    )
-    bpy.types.Scene.prop_plasticity_live_expand_auto_merge_seams = bpy.props.BoolProperty(
+    )),
+    ("prop_plasticity_live_expand_auto_merge_seams", bpy.props.BoolProperty(
         name="Auto Merge / Reset Seams on Selection",
         description=(
             "Automatically updates seams from the current face selection in Edit Mode. "
@@ -886,8 +1148,8 @@ def register():
         ),
         default=False,
         update=update_live_expand_auto_merge_seams,
-    )
-    bpy.types.Scene.prop_plasticity_auto_seam_mode = bpy.props.EnumProperty(
+    )),
+    ("prop_plasticity_auto_seam_mode", bpy.props.EnumProperty(
         name="Auto Create Seam",
         description=(
             "Automatically create a seam based on the selected surface type. "
@@ -902,8 +1164,8 @@ def register():
             ('SPHERE_OPEN', "Sphere + Open Cap", "Create a meridian seam plus an open rim seam"),
         ],
         default='CYLINDER',
-    )
-    bpy.types.Scene.prop_plasticity_auto_cylinder_seam_mode = bpy.props.EnumProperty(
+    )),
+    ("prop_plasticity_auto_cylinder_seam_mode", bpy.props.EnumProperty(
         name="Cylinder Seam Mode",
         description="When to insert a cylinder seam",
         items=[
@@ -911,8 +1173,8 @@ def register():
             ('PARTIAL', "Partial + Full", "Also insert seams on large partial wraps"),
         ],
         default='FULL',
-    )
-    bpy.types.Scene.prop_plasticity_auto_cylinder_partial_angle = bpy.props.FloatProperty(
+    )),
+    ("prop_plasticity_auto_cylinder_partial_angle", bpy.props.FloatProperty(
         name="Partial Wrap Angle",
         description="Minimum wrap angle (degrees) to insert a seam on partial cylinders",
         default=200.0,
@@ -920,13 +1182,13 @@ def register():
         max=360.0,
         step=1.0,
         precision=1,
-    )
-    bpy.types.Scene.prop_plasticity_auto_cylinder_seam_occluded_only = bpy.props.BoolProperty(
+    )),
+    ("prop_plasticity_auto_cylinder_seam_occluded_only", bpy.props.BoolProperty(
         name="Occluded Only (View)",
         description="Only place auto cylinder seams on edges occluded from the active 3D view",
         default=False,
-    )
-    bpy.types.Scene.prop_plasticity_live_expand_edge_thickness = bpy.props.FloatProperty(
+    )),
+    ("prop_plasticity_live_expand_edge_thickness", bpy.props.FloatProperty(
         name="Plasticity Edge Highlight Thickness",
         description="Thickness of Plasticity boundary edges overlay",
         default=3.0,
@@ -934,13 +1196,13 @@ def register():
         max=10.0,
         step=0.1,
         precision=1,
-    )
-    bpy.types.Scene.prop_plasticity_live_expand_edge_occlude = bpy.props.BoolProperty(
+    )),
+    ("prop_plasticity_live_expand_edge_occlude", bpy.props.BoolProperty(
         name="Occlude Hidden Edges",
         description="Hide Plasticity edge highlights when occluded by geometry",
         default=True,
-    )
-    bpy.types.Scene.prop_plasticity_live_expand_overlay_color = bpy.props.FloatVectorProperty(
+    )),
+    ("prop_plasticity_live_expand_overlay_color", bpy.props.FloatVectorProperty(
         name="Plasticity Edge Highlight Color",
         description="Color used for the Plasticity edge highlight overlay",
         default=(0.0, 1.0, 0.0, 1.0),
@@ -948,10 +1210,10 @@ def register():
         min=0.0,
         max=1.0,
         subtype='COLOR',
-    )
-    bpy.types.Scene.prop_plasticity_ui_show_advanced_facet = bpy.props.BoolProperty(name="Advanced", default=False)
-    bpy.types.Scene.prop_plasticity_ui_show_refacet = bpy.props.BoolProperty(name="Refacet", default=True)
-    bpy.types.Scene.prop_plasticity_live_refacet = bpy.props.BoolProperty(
+    )),
+    ("prop_plasticity_ui_show_advanced_facet", bpy.props.BoolProperty(name="Advanced", default=False)),
+    ("prop_plasticity_ui_show_refacet", bpy.props.BoolProperty(name="Refacet", default=True)),
+    ("prop_plasticity_live_refacet", bpy.props.BoolProperty(
         name="Live Refacet",
         description=(
             "Automatically refacet objects when Refacet settings change. "
@@ -959,8 +1221,8 @@ def register():
         ),
         default=False,
         update=update_live_refacet,
-    )
-    bpy.types.Scene.prop_plasticity_live_refacet_only_selected = bpy.props.BoolProperty(
+    )),
+    ("prop_plasticity_live_refacet_only_selected", bpy.props.BoolProperty(
         name="Only Selected",
         description=(
             "Use only selected objects in Blender. "
@@ -969,8 +1231,8 @@ def register():
         ),
         default=True,
         update=update_live_refacet_only_selected,
-    )
-    bpy.types.Scene.prop_plasticity_live_refacet_interval = bpy.props.FloatProperty(
+    )),
+    ("prop_plasticity_live_refacet_interval", bpy.props.FloatProperty(
         name="Live Refacet Interval",
         description="Seconds between live refacet checks",
         default=0.2,
@@ -979,47 +1241,34 @@ def register():
         step=0.1,
         precision=2,
         subtype='TIME',
-    )
-    bpy.types.Scene.prop_plasticity_ui_tab = bpy.props.EnumProperty(
-        items=[
-            ("PINNED", "Pinned", "Pinned items only"),
-            ("MAIN", "Main", "Connection, live link, refresh, filters, scale"),
-            ("REFACET", "Refacet", "Refacet, presets, density/tolerance, live refacet"),
-            ("UTILITIES", "Utilities", "Selection, marking, and paint utilities"),
-            ("UV_TOOLS", "UV / Material / Texture Tools", "Unwrap, UV editor, UVs, materials, textures"),
-            ("MESH_TOOLS", "Mesh Tools", "Selection, joins, merge, mirror, modifiers, import/export"),
-            ("PREFERENCES", "Preferences", "General add-on behavior and workflow options"),
-        ],
-        name="Plasticity Tabs",
-        default="MAIN",
-    )
-    bpy.types.Scene.prop_plasticity_ui_show_utilities = bpy.props.BoolProperty(name="Utilities", default=True)
-    bpy.types.Scene.prop_plasticity_ui_util_auto_mark_edges = bpy.props.BoolProperty(
+    )),
+    ("prop_plasticity_ui_show_utilities", bpy.props.BoolProperty(name="Utilities", default=True)),
+    ("prop_plasticity_ui_util_auto_mark_edges", bpy.props.BoolProperty(
         name="Auto Mark Edges",
         default=False,
         update=update_util_auto_mark_edges,
-    )
-    bpy.types.Scene.prop_plasticity_ui_util_merge_uv_seams = bpy.props.BoolProperty(
+    )),
+    ("prop_plasticity_ui_util_merge_uv_seams", bpy.props.BoolProperty(
         name="Merge UV Seams",
         default=False,
         update=update_util_merge_uv_seams,
-    )
-    bpy.types.Scene.prop_plasticity_ui_util_select_faces = bpy.props.BoolProperty(
+    )),
+    ("prop_plasticity_ui_util_select_faces", bpy.props.BoolProperty(
         name="Select Plasticity Face(s)",
         default=False,
         update=update_util_select_faces,
-    )
-    bpy.types.Scene.prop_plasticity_ui_util_select_edges = bpy.props.BoolProperty(
+    )),
+    ("prop_plasticity_ui_util_select_edges", bpy.props.BoolProperty(
         name="Select Plasticity Edges",
         default=False,
         update=update_util_select_edges,
-    )
-    bpy.types.Scene.prop_plasticity_ui_util_paint_faces = bpy.props.BoolProperty(
+    )),
+    ("prop_plasticity_ui_util_paint_faces", bpy.props.BoolProperty(
         name="Paint Plasticity Faces",
         default=False,
         update=update_util_paint_faces,
-    )
-    bpy.types.Scene.prop_plasticity_paint_faces_mode = bpy.props.EnumProperty(
+    )),
+    ("prop_plasticity_paint_faces_mode", bpy.props.EnumProperty(
         name="Paint Mode",
         description="Choose whether to only write the color attribute or also assign a preview material",
         items=[
@@ -1028,27 +1277,27 @@ def register():
         ],
         default="MATERIAL_ATTR",
         update=update_live_paint_faces_settings,
-    )
-    bpy.types.Scene.prop_plasticity_paint_faces_attribute_name = bpy.props.StringProperty(
+    )),
+    ("prop_plasticity_paint_faces_attribute_name", bpy.props.StringProperty(
         name="Color Attribute",
         description="Name of the color attribute used for Plasticity face colors",
         default="plasticity_face_color",
         update=update_live_paint_faces_settings,
-    )
-    bpy.types.Scene.prop_plasticity_live_paint_faces = bpy.props.BoolProperty(
+    )),
+    ("prop_plasticity_live_paint_faces", bpy.props.BoolProperty(
         name="Live Paint Plasticity Faces",
         description="Automatically refresh Plasticity face colors when mesh data changes",
         default=False,
         update=update_live_paint_faces,
-    )
-    bpy.types.Scene.prop_plasticity_ui_util_highlight = bpy.props.BoolProperty(
+    )),
+    ("prop_plasticity_ui_util_highlight", bpy.props.BoolProperty(
         name="Plasticity Edge Highlight",
         default=False,
         update=update_util_highlight,
-    )
-    bpy.types.Scene.prop_plasticity_ui_show_uv_tools = bpy.props.BoolProperty(name="UV Tools", default=True)
-    bpy.types.Scene.prop_plasticity_ui_show_mesh_tools = bpy.props.BoolProperty(name="Mesh Tools", default=True)
-    bpy.types.Scene.prop_plasticity_object_transform_control_mode = bpy.props.EnumProperty(
+    )),
+    ("prop_plasticity_ui_show_uv_tools", bpy.props.BoolProperty(name="UV Tools", default=True)),
+    ("prop_plasticity_ui_show_mesh_tools", bpy.props.BoolProperty(name="Mesh Tools", default=True)),
+    ("prop_plasticity_object_transform_control_mode", bpy.props.EnumProperty(
         name="Plasticity Object Transform Control",
         items=[
             ("PLASTICITY", "Plasticity", "Use the imported/default transform behavior on future rebuilds"),
@@ -1056,80 +1305,80 @@ def register():
         ],
         default="PLASTICITY",
         update=update_object_transform_control_mode,
-    )
-    bpy.types.Scene.prop_plasticity_pin_live_link = bpy.props.BoolProperty(name="Pin Live Link", default=False)
-    bpy.types.Scene.prop_plasticity_pin_refresh = bpy.props.BoolProperty(name="Pin Refresh", default=False)
-    bpy.types.Scene.prop_plasticity_pin_only_visible = bpy.props.BoolProperty(name="Pin Only Visible", default=False)
-    bpy.types.Scene.prop_plasticity_pin_only_selected = bpy.props.BoolProperty(name="Pin Only Selected", default=False)
-    bpy.types.Scene.prop_plasticity_pin_only_new = bpy.props.BoolProperty(name="Pin Only New", default=False)
-    bpy.types.Scene.prop_plasticity_pin_scale = bpy.props.BoolProperty(name="Pin Scale", default=False)
-    bpy.types.Scene.prop_plasticity_pin_send_to_plasticity = bpy.props.BoolProperty(name="Pin Send to Plasticity", default=False)
-    bpy.types.Scene.prop_plasticity_pin_send_create_subd = bpy.props.BoolProperty(name="Pin Send Create Sub-D", default=False)
-    bpy.types.Scene.prop_plasticity_pin_send_rounded_corners = bpy.props.BoolProperty(name="Pin Rounded corners", default=False)
-    bpy.types.Scene.prop_plasticity_pin_send_merge_patches = bpy.props.BoolProperty(name="Pin Merge patches", default=False)
-    bpy.types.Scene.prop_plasticity_pin_send_interpolate_boundary = bpy.props.BoolProperty(name="Pin Interpolate boundary exactly", default=False)
-    bpy.types.Scene.prop_plasticity_pin_refacet = bpy.props.BoolProperty(name="Pin Refacet", default=True)
-    bpy.types.Scene.prop_plasticity_pin_live_refacet_only_selected = bpy.props.BoolProperty(name="Pin Live Refacet Only Selected", default=False)
-    bpy.types.Scene.prop_plasticity_pin_live_refacet = bpy.props.BoolProperty(name="Pin Live Refacet Mode", default=False)
-    bpy.types.Scene.prop_plasticity_pin_auto_mark_edges = bpy.props.BoolProperty(name="Pin Auto Mark Edges", default=False)
-    bpy.types.Scene.prop_plasticity_pin_merge_uv_seams = bpy.props.BoolProperty(name="Pin Merge UV Seams", default=False)
-    bpy.types.Scene.prop_plasticity_pin_select_faces = bpy.props.BoolProperty(name="Pin Select Faces", default=False)
-    bpy.types.Scene.prop_plasticity_pin_select_edges = bpy.props.BoolProperty(name="Pin Select Edges", default=False)
-    bpy.types.Scene.prop_plasticity_pin_paint_faces = bpy.props.BoolProperty(name="Pin Paint Faces", default=False)
-    bpy.types.Scene.prop_plasticity_pin_paint_faces_mode = bpy.props.BoolProperty(name="Pin Paint Faces Mode", default=False)
-    bpy.types.Scene.prop_plasticity_pin_paint_faces_attribute_name = bpy.props.BoolProperty(name="Pin Paint Faces Color Attribute", default=False)
-    bpy.types.Scene.prop_plasticity_pin_live_paint_faces = bpy.props.BoolProperty(name="Pin Live Paint Faces", default=False)
-    bpy.types.Scene.prop_plasticity_pin_live_expand = bpy.props.BoolProperty(name="Pin Live Expand Selection", default=True)
-    bpy.types.Scene.prop_plasticity_pin_live_expand_auto_circle = bpy.props.BoolProperty(name="Pin Auto Circle Select Mode", default=True)
-    bpy.types.Scene.prop_plasticity_pin_live_expand_auto_select_cylinders = bpy.props.BoolProperty(name="Pin Auto Select Cylinders", default=True)
-    bpy.types.Scene.prop_plasticity_pin_live_expand_cylinder_min_wrap_angle = bpy.props.BoolProperty(name="Pin Cylinder Min Wrap Angle", default=True)
-    bpy.types.Scene.prop_plasticity_pin_live_expand_interval = bpy.props.BoolProperty(name="Pin Update Interval", default=False)
-    bpy.types.Scene.prop_plasticity_pin_live_expand_auto_merge_seams = bpy.props.BoolProperty(name="Pin Auto Merge Seams", default=True)
-    bpy.types.Scene.prop_plasticity_pin_auto_seam_mode = bpy.props.BoolProperty(name="Pin Auto Create Seam", default=True)
-    bpy.types.Scene.prop_plasticity_pin_auto_cylinder_seam_mode = bpy.props.BoolProperty(name="Pin Cylinder Seam Mode", default=False)
-    bpy.types.Scene.prop_plasticity_pin_auto_cylinder_partial_angle = bpy.props.BoolProperty(name="Pin Partial Wrap Angle", default=False)
-    bpy.types.Scene.prop_plasticity_pin_auto_cylinder_seam_occluded_only = bpy.props.BoolProperty(name="Pin Occluded Only", default=False)
-    bpy.types.Scene.prop_plasticity_pin_relax_uvs = bpy.props.BoolProperty(name="Pin Relax UVs", default=True)
-    bpy.types.Scene.prop_plasticity_pin_select_adjacent_fillets = bpy.props.BoolProperty(name="Pin Select Adjacent Fillets", default=False)
-    bpy.types.Scene.prop_plasticity_pin_select_fillet_min_curvature_angle = bpy.props.BoolProperty(name="Pin Min Curvature Angle", default=False)
-    bpy.types.Scene.prop_plasticity_pin_select_fillet_max_area_ratio = bpy.props.BoolProperty(name="Pin Max Area Ratio", default=False)
-    bpy.types.Scene.prop_plasticity_pin_select_fillet_min_adjacent_groups = bpy.props.BoolProperty(name="Pin Min Adjacent Groups", default=False)
-    bpy.types.Scene.prop_plasticity_pin_select_include_vertex_adjacency = bpy.props.BoolProperty(name="Pin Include Vertex Adjacent", default=False)
-    bpy.types.Scene.prop_plasticity_pin_select_vertex_adjacent_max_length_ratio = bpy.props.BoolProperty(name="Pin Max Vertex Adjacent Length Ratio", default=False)
-    bpy.types.Scene.prop_plasticity_pin_live_expand_edge_highlight = bpy.props.BoolProperty(name="Pin Plasticity Edge Highlight", default=True)
-    bpy.types.Scene.prop_plasticity_pin_live_expand_active_view_only = bpy.props.BoolProperty(name="Pin Active View Only", default=False)
-    bpy.types.Scene.prop_plasticity_pin_live_expand_edge_occlude = bpy.props.BoolProperty(name="Pin Occlude Hidden Edges", default=False)
-    bpy.types.Scene.prop_plasticity_pin_live_expand_edge_thickness = bpy.props.BoolProperty(name="Pin Edge Highlight Thickness", default=False)
-    bpy.types.Scene.prop_plasticity_pin_live_expand_overlay_color = bpy.props.BoolProperty(name="Pin Edge Highlight Color", default=False)
-    bpy.types.Scene.prop_plasticity_pin_uv_unwrap = bpy.props.BoolProperty(name="Pin Unwrap", default=True)
-    bpy.types.Scene.prop_plasticity_pin_uv_pack_islands = bpy.props.BoolProperty(name="Pin Pack UV Islands", default=True)
-    bpy.types.Scene.prop_plasticity_pin_uv_open_editor = bpy.props.BoolProperty(name="Pin Open UV Editor", default=True)
-    bpy.types.Scene.prop_plasticity_pin_uv_close_editor = bpy.props.BoolProperty(name="Pin Close UV Editor", default=False)
-    bpy.types.Scene.prop_plasticity_pin_uv_select_without_uvs = bpy.props.BoolProperty(name="Pin Select Objects Without UVs", default=False)
-    bpy.types.Scene.prop_plasticity_pin_uv_remove_uvs = bpy.props.BoolProperty(name="Pin Remove UVs", default=False)
-    bpy.types.Scene.prop_plasticity_pin_uv_remove_materials = bpy.props.BoolProperty(name="Pin Remove Materials", default=False)
-    bpy.types.Scene.prop_plasticity_pin_uv_reload_textures = bpy.props.BoolProperty(name="Pin Reload Textures", default=False)
-    bpy.types.Scene.prop_plasticity_pin_uv_assign_checker = bpy.props.BoolProperty(name="Pin Assign Checker", default=True)
-    bpy.types.Scene.prop_plasticity_pin_uv_remove_checker = bpy.props.BoolProperty(name="Pin Remove Checker Material", default=False)
-    bpy.types.Scene.prop_plasticity_pin_mesh_select_similar = bpy.props.BoolProperty(name="Pin Select Similar Geometry", default=True)
-    bpy.types.Scene.prop_plasticity_pin_mesh_object_transform_control_mode = bpy.props.BoolProperty(name="Pin Object Transform Control Mode", default=False)
-    bpy.types.Scene.prop_plasticity_pin_mesh_join = bpy.props.BoolProperty(name="Pin Join Selected", default=False)
-    bpy.types.Scene.prop_plasticity_pin_mesh_unjoin = bpy.props.BoolProperty(name="Pin Unjoin Selected", default=False)
-    bpy.types.Scene.prop_plasticity_pin_mesh_merge_nonoverlapping = bpy.props.BoolProperty(name="Pin Merge Non-overlapping Meshes", default=False)
-    bpy.types.Scene.prop_plasticity_pin_mesh_overlap_threshold = bpy.props.BoolProperty(name="Pin Overlap Threshold", default=False)
-    bpy.types.Scene.prop_plasticity_pin_mesh_select_ngons = bpy.props.BoolProperty(name="Pin Select Meshes with Ngons", default=False)
-    bpy.types.Scene.prop_plasticity_pin_mesh_mirror = bpy.props.BoolProperty(name="Pin Mirror Selected", default=False)
-    bpy.types.Scene.prop_plasticity_pin_mesh_mirror_axis = bpy.props.BoolProperty(name="Pin Mirror Axis", default=False)
-    bpy.types.Scene.prop_plasticity_pin_mesh_mirror_center = bpy.props.BoolProperty(name="Pin Mirror Center", default=False)
-    bpy.types.Scene.prop_plasticity_pin_mesh_remove_modifiers = bpy.props.BoolProperty(name="Pin Remove Modifiers", default=False)
-    bpy.types.Scene.prop_plasticity_pin_mesh_apply_modifiers = bpy.props.BoolProperty(name="Pin Apply Modifiers", default=False)
-    bpy.types.Scene.prop_plasticity_pin_mesh_remove_vertex_groups = bpy.props.BoolProperty(name="Pin Remove Vertex Groups", default=False)
-    bpy.types.Scene.prop_plasticity_pin_mesh_snap_cursor = bpy.props.BoolProperty(name="Pin Snap to 3D Cursor", default=False)
-    bpy.types.Scene.prop_plasticity_pin_mesh_import_fbx = bpy.props.BoolProperty(name="Pin Import FBX", default=False)
-    bpy.types.Scene.prop_plasticity_pin_mesh_export_fbx = bpy.props.BoolProperty(name="Pin Export FBX", default=False)
-    bpy.types.Scene.prop_plasticity_pin_mesh_import_obj = bpy.props.BoolProperty(name="Pin Import OBJ", default=False)
-    bpy.types.Scene.prop_plasticity_pin_mesh_export_obj = bpy.props.BoolProperty(name="Pin Export OBJ", default=False)
-    bpy.types.Scene.prop_plasticity_checker_source = bpy.props.EnumProperty(
+    )),
+    ("prop_plasticity_pin_live_link", bpy.props.BoolProperty(name="Pin Live Link", default=False)),
+    ("prop_plasticity_pin_refresh", bpy.props.BoolProperty(name="Pin Refresh", default=False)),
+    ("prop_plasticity_pin_only_visible", bpy.props.BoolProperty(name="Pin Only Visible", default=False)),
+    ("prop_plasticity_pin_only_selected", bpy.props.BoolProperty(name="Pin Only Selected", default=False)),
+    ("prop_plasticity_pin_only_new", bpy.props.BoolProperty(name="Pin Only New", default=False)),
+    ("prop_plasticity_pin_scale", bpy.props.BoolProperty(name="Pin Scale", default=False)),
+    ("prop_plasticity_pin_send_to_plasticity", bpy.props.BoolProperty(name="Pin Send to Plasticity", default=False)),
+    ("prop_plasticity_pin_send_create_subd", bpy.props.BoolProperty(name="Pin Send Create Sub-D", default=False)),
+    ("prop_plasticity_pin_send_rounded_corners", bpy.props.BoolProperty(name="Pin Rounded corners", default=False)),
+    ("prop_plasticity_pin_send_merge_patches", bpy.props.BoolProperty(name="Pin Merge patches", default=False)),
+    ("prop_plasticity_pin_send_interpolate_boundary", bpy.props.BoolProperty(name="Pin Interpolate boundary exactly", default=False)),
+    ("prop_plasticity_pin_refacet", bpy.props.BoolProperty(name="Pin Refacet", default=True)),
+    ("prop_plasticity_pin_live_refacet_only_selected", bpy.props.BoolProperty(name="Pin Live Refacet Only Selected", default=False)),
+    ("prop_plasticity_pin_live_refacet", bpy.props.BoolProperty(name="Pin Live Refacet Mode", default=False)),
+    ("prop_plasticity_pin_auto_mark_edges", bpy.props.BoolProperty(name="Pin Auto Mark Edges", default=False)),
+    ("prop_plasticity_pin_merge_uv_seams", bpy.props.BoolProperty(name="Pin Merge UV Seams", default=False)),
+    ("prop_plasticity_pin_select_faces", bpy.props.BoolProperty(name="Pin Select Faces", default=False)),
+    ("prop_plasticity_pin_select_edges", bpy.props.BoolProperty(name="Pin Select Edges", default=False)),
+    ("prop_plasticity_pin_paint_faces", bpy.props.BoolProperty(name="Pin Paint Faces", default=False)),
+    ("prop_plasticity_pin_paint_faces_mode", bpy.props.BoolProperty(name="Pin Paint Faces Mode", default=False)),
+    ("prop_plasticity_pin_paint_faces_attribute_name", bpy.props.BoolProperty(name="Pin Paint Faces Color Attribute", default=False)),
+    ("prop_plasticity_pin_live_paint_faces", bpy.props.BoolProperty(name="Pin Live Paint Faces", default=False)),
+    ("prop_plasticity_pin_live_expand", bpy.props.BoolProperty(name="Pin Live Expand Selection", default=True)),
+    ("prop_plasticity_pin_live_expand_auto_circle", bpy.props.BoolProperty(name="Pin Auto Circle Select Mode", default=True)),
+    ("prop_plasticity_pin_live_expand_auto_select_cylinders", bpy.props.BoolProperty(name="Pin Auto Select Cylinders", default=True)),
+    ("prop_plasticity_pin_live_expand_cylinder_min_wrap_angle", bpy.props.BoolProperty(name="Pin Cylinder Min Wrap Angle", default=True)),
+    ("prop_plasticity_pin_live_expand_interval", bpy.props.BoolProperty(name="Pin Update Interval", default=False)),
+    ("prop_plasticity_pin_live_expand_auto_merge_seams", bpy.props.BoolProperty(name="Pin Auto Merge Seams", default=True)),
+    ("prop_plasticity_pin_auto_seam_mode", bpy.props.BoolProperty(name="Pin Auto Create Seam", default=True)),
+    ("prop_plasticity_pin_auto_cylinder_seam_mode", bpy.props.BoolProperty(name="Pin Cylinder Seam Mode", default=False)),
+    ("prop_plasticity_pin_auto_cylinder_partial_angle", bpy.props.BoolProperty(name="Pin Partial Wrap Angle", default=False)),
+    ("prop_plasticity_pin_auto_cylinder_seam_occluded_only", bpy.props.BoolProperty(name="Pin Occluded Only", default=False)),
+    ("prop_plasticity_pin_relax_uvs", bpy.props.BoolProperty(name="Pin Relax UVs", default=True)),
+    ("prop_plasticity_pin_select_adjacent_fillets", bpy.props.BoolProperty(name="Pin Select Adjacent Fillets", default=False)),
+    ("prop_plasticity_pin_select_fillet_min_curvature_angle", bpy.props.BoolProperty(name="Pin Min Curvature Angle", default=False)),
+    ("prop_plasticity_pin_select_fillet_max_area_ratio", bpy.props.BoolProperty(name="Pin Max Area Ratio", default=False)),
+    ("prop_plasticity_pin_select_fillet_min_adjacent_groups", bpy.props.BoolProperty(name="Pin Min Adjacent Groups", default=False)),
+    ("prop_plasticity_pin_select_include_vertex_adjacency", bpy.props.BoolProperty(name="Pin Include Vertex Adjacent", default=False)),
+    ("prop_plasticity_pin_select_vertex_adjacent_max_length_ratio", bpy.props.BoolProperty(name="Pin Max Vertex Adjacent Length Ratio", default=False)),
+    ("prop_plasticity_pin_live_expand_edge_highlight", bpy.props.BoolProperty(name="Pin Plasticity Edge Highlight", default=True)),
+    ("prop_plasticity_pin_live_expand_active_view_only", bpy.props.BoolProperty(name="Pin Active View Only", default=False)),
+    ("prop_plasticity_pin_live_expand_edge_occlude", bpy.props.BoolProperty(name="Pin Occlude Hidden Edges", default=False)),
+    ("prop_plasticity_pin_live_expand_edge_thickness", bpy.props.BoolProperty(name="Pin Edge Highlight Thickness", default=False)),
+    ("prop_plasticity_pin_live_expand_overlay_color", bpy.props.BoolProperty(name="Pin Edge Highlight Color", default=False)),
+    ("prop_plasticity_pin_uv_unwrap", bpy.props.BoolProperty(name="Pin Unwrap", default=True)),
+    ("prop_plasticity_pin_uv_pack_islands", bpy.props.BoolProperty(name="Pin Pack UV Islands", default=True)),
+    ("prop_plasticity_pin_uv_open_editor", bpy.props.BoolProperty(name="Pin Open UV Editor", default=True)),
+    ("prop_plasticity_pin_uv_close_editor", bpy.props.BoolProperty(name="Pin Close UV Editor", default=False)),
+    ("prop_plasticity_pin_uv_select_without_uvs", bpy.props.BoolProperty(name="Pin Select Objects Without UVs", default=False)),
+    ("prop_plasticity_pin_uv_remove_uvs", bpy.props.BoolProperty(name="Pin Remove UVs", default=False)),
+    ("prop_plasticity_pin_uv_remove_materials", bpy.props.BoolProperty(name="Pin Remove Materials", default=False)),
+    ("prop_plasticity_pin_uv_reload_textures", bpy.props.BoolProperty(name="Pin Reload Textures", default=False)),
+    ("prop_plasticity_pin_uv_assign_checker", bpy.props.BoolProperty(name="Pin Assign Checker", default=True)),
+    ("prop_plasticity_pin_uv_remove_checker", bpy.props.BoolProperty(name="Pin Remove Checker Material", default=False)),
+    ("prop_plasticity_pin_mesh_select_similar", bpy.props.BoolProperty(name="Pin Select Similar Geometry", default=True)),
+    ("prop_plasticity_pin_mesh_object_transform_control_mode", bpy.props.BoolProperty(name="Pin Object Transform Control Mode", default=False)),
+    ("prop_plasticity_pin_mesh_join", bpy.props.BoolProperty(name="Pin Join Selected", default=False)),
+    ("prop_plasticity_pin_mesh_unjoin", bpy.props.BoolProperty(name="Pin Unjoin Selected", default=False)),
+    ("prop_plasticity_pin_mesh_merge_nonoverlapping", bpy.props.BoolProperty(name="Pin Merge Non-overlapping Meshes", default=False)),
+    ("prop_plasticity_pin_mesh_overlap_threshold", bpy.props.BoolProperty(name="Pin Overlap Threshold", default=False)),
+    ("prop_plasticity_pin_mesh_select_ngons", bpy.props.BoolProperty(name="Pin Select Meshes with Ngons", default=False)),
+    ("prop_plasticity_pin_mesh_mirror", bpy.props.BoolProperty(name="Pin Mirror Selected", default=False)),
+    ("prop_plasticity_pin_mesh_mirror_axis", bpy.props.BoolProperty(name="Pin Mirror Axis", default=False)),
+    ("prop_plasticity_pin_mesh_mirror_center", bpy.props.BoolProperty(name="Pin Mirror Center", default=False)),
+    ("prop_plasticity_pin_mesh_remove_modifiers", bpy.props.BoolProperty(name="Pin Remove Modifiers", default=False)),
+    ("prop_plasticity_pin_mesh_apply_modifiers", bpy.props.BoolProperty(name="Pin Apply Modifiers", default=False)),
+    ("prop_plasticity_pin_mesh_remove_vertex_groups", bpy.props.BoolProperty(name="Pin Remove Vertex Groups", default=False)),
+    ("prop_plasticity_pin_mesh_snap_cursor", bpy.props.BoolProperty(name="Pin Snap to 3D Cursor", default=False)),
+    ("prop_plasticity_pin_mesh_import_fbx", bpy.props.BoolProperty(name="Pin Import FBX", default=False)),
+    ("prop_plasticity_pin_mesh_export_fbx", bpy.props.BoolProperty(name="Pin Export FBX", default=False)),
+    ("prop_plasticity_pin_mesh_import_obj", bpy.props.BoolProperty(name="Pin Import OBJ", default=False)),
+    ("prop_plasticity_pin_mesh_export_obj", bpy.props.BoolProperty(name="Pin Export OBJ", default=False)),
+    ("prop_plasticity_checker_source", bpy.props.EnumProperty(
         items=[
             ("LIBRARY", "Checker Textures Library", "Use bundled checker textures"),
             ("FILE", "Custom Checker Texture", "Use a custom checker image"),
@@ -1137,20 +1386,20 @@ def register():
         name="Checker Source",
         default="LIBRARY",
         update=update_checker_source,
-    )
-    bpy.types.Scene.prop_plasticity_checker_image = bpy.props.EnumProperty(
+    )),
+    ("prop_plasticity_checker_image", bpy.props.EnumProperty(
         items=operators.get_checker_image_items,
         name="Checker Texture",
         # Blender 4.5 requires an integer index default when items is a callback.
         default=0,
         update=update_checker_image,
-    )
-    bpy.types.Scene.prop_plasticity_pref_auto_assign_checker_on_select = bpy.props.BoolProperty(
+    )),
+    ("prop_plasticity_pref_auto_assign_checker_on_select", bpy.props.BoolProperty(
         name="Auto Assign Checker on Selection",
         description="Automatically assign the selected checker texture to selected mesh objects/faces",
         default=False,
-    )
-    bpy.types.Scene.prop_plasticity_pref_fbx_export_backend = bpy.props.EnumProperty(
+    )),
+    ("prop_plasticity_pref_fbx_export_backend", bpy.props.EnumProperty(
         name="FBX import / Export",
         description=(
             "Choose which FBX importer/exporter to use. "
@@ -1161,45 +1410,45 @@ def register():
             ("BETTER_FBX", "Better FBX", "Use Better FBX import/export tools when available"),
         ],
         default="BLENDER",
-    )
-    bpy.types.Scene.prop_plasticity_checker_custom_path = bpy.props.StringProperty(
+    )),
+    ("prop_plasticity_checker_custom_path", bpy.props.StringProperty(
         name="Checker Image",
         subtype="FILE_PATH",
         default="",
         update=update_checker_custom_path,
-    )
-    bpy.types.Scene.prop_plasticity_facet_min_width = bpy.props.FloatProperty(name="Min Width", default=0.01, min=0, max=10, unit="LENGTH")
-    bpy.types.Scene.prop_plasticity_facet_min_width_enabled = bpy.props.BoolProperty(
+    )),
+    ("prop_plasticity_facet_min_width", bpy.props.FloatProperty(name="Min Width", default=0.01, min=0, max=10, unit="LENGTH")),
+    ("prop_plasticity_facet_min_width_enabled", bpy.props.BoolProperty(
         name="Min Width",
         default=False,
-    )
-    bpy.types.Scene.prop_plasticity_facet_max_width = bpy.props.FloatProperty(name="Max Width", default=1.0, min=0.0001, max=1000.0, step=0.01, soft_min=0.02, precision=6, unit="LENGTH")
-    bpy.types.Scene.prop_plasticity_facet_max_width_enabled = bpy.props.BoolProperty(
+    )),
+    ("prop_plasticity_facet_max_width", bpy.props.FloatProperty(name="Max Width", default=1.0, min=0.0001, max=1000.0, step=0.01, soft_min=0.02, precision=6, unit="LENGTH")),
+    ("prop_plasticity_facet_max_width_enabled", bpy.props.BoolProperty(
         name="Max Width",
         default=False,
-    )
-    bpy.types.Scene.prop_plasticity_unit_scale = bpy.props.FloatProperty(name="Unit Scale", default=1.0, min=0.0001, max=1000.0)
-    bpy.types.Scene.prop_plasticity_curve_chord_tolerance = bpy.props.FloatProperty(name="Edge chord tolerance", default=0.01, min=0.0001, step=0.01, max=1.0, precision=6)
-    bpy.types.Scene.prop_plasticity_curve_angle_tolerance = bpy.props.FloatProperty(name="Edge Angle tolerance", default=0.45, min=0.1, max=1.0)
-    bpy.types.Scene.prop_plasticity_surface_plane_tolerance = bpy.props.FloatProperty(name="Face plane tolerance", default=0.01, min=0.0001, step=0.01, max=1.0, precision=6)
-    bpy.types.Scene.prop_plasticity_surface_angle_tolerance = bpy.props.FloatProperty(name="Face Angle tolerance", default=0.45, min=0.1, max=1.0)
-    bpy.types.Scene.prop_plasticity_plane_angle = bpy.props.FloatProperty(
+    )),
+    ("prop_plasticity_unit_scale", bpy.props.FloatProperty(name="Unit Scale", default=1.0, min=0.0001, max=1000.0)),
+    ("prop_plasticity_curve_chord_tolerance", bpy.props.FloatProperty(name="Edge chord tolerance", default=0.01, min=0.0001, step=0.01, max=1.0, precision=6)),
+    ("prop_plasticity_curve_angle_tolerance", bpy.props.FloatProperty(name="Edge Angle tolerance", default=0.45, min=0.1, max=1.0)),
+    ("prop_plasticity_surface_plane_tolerance", bpy.props.FloatProperty(name="Face plane tolerance", default=0.01, min=0.0001, step=0.01, max=1.0, precision=6)),
+    ("prop_plasticity_surface_angle_tolerance", bpy.props.FloatProperty(name="Face Angle tolerance", default=0.45, min=0.1, max=1.0)),
+    ("prop_plasticity_plane_angle", bpy.props.FloatProperty(
         name="Plane Angle",
         default=0.1,
         min=0.0,
         max=3.14159,
         step=0.01,
         precision=4,
-    )
-    bpy.types.Scene.prop_plasticity_convex_ngons_only = bpy.props.BoolProperty(
+    )),
+    ("prop_plasticity_convex_ngons_only", bpy.props.BoolProperty(
         name="Convex Ngons Only",
         default=False,
-    )
-    bpy.types.Scene.prop_plasticity_curve_max_length_enabled = bpy.props.BoolProperty(
+    )),
+    ("prop_plasticity_curve_max_length_enabled", bpy.props.BoolProperty(
         name="Curve Max Length",
         default=False,
-    )
-    bpy.types.Scene.prop_plasticity_curve_max_length = bpy.props.FloatProperty(
+    )),
+    ("prop_plasticity_curve_max_length", bpy.props.FloatProperty(
         name="Curve Max Length",
         default=0.0,
         min=0.0,
@@ -1207,27 +1456,25 @@ def register():
         step=0.01,
         precision=6,
         unit="LENGTH",
-    )
-    bpy.types.Scene.prop_plasticity_relative_to_bbox = bpy.props.BoolProperty(
+    )),
+    ("prop_plasticity_relative_to_bbox", bpy.props.BoolProperty(
         name="Relative to BBox",
         default=True,
-    )
-    bpy.types.Scene.prop_plasticity_match_topology = bpy.props.BoolProperty(
+    )),
+    ("prop_plasticity_match_topology", bpy.props.BoolProperty(
         name="Match Topology",
         default=True,
-    )
-    bpy.types.Scene.mark_seam = bpy.props.BoolProperty(name="Mark Seam")
-    bpy.types.Scene.mark_sharp = bpy.props.BoolProperty(name="Mark Sharp")
-    bpy.types.WindowManager.plasticity_busy = bpy.props.BoolProperty(name="Plasticity busy", default=False, options={'HIDDEN'}
-)
-    bpy.types.Scene.overlap_threshold = bpy.props.FloatProperty(
+    )),
+    ("mark_seam", bpy.props.BoolProperty(name="Mark Seam")),
+    ("mark_sharp", bpy.props.BoolProperty(name="Mark Sharp")),
+    ("overlap_threshold", bpy.props.FloatProperty(
         name="Overlap Threshold",
         description="The threshold below which two meshes are considered to be overlapping",
         default=0.01,
         min=0.0,
         max=1.0,
-    )
-    bpy.types.Scene.mirror_axis = bpy.props.EnumProperty(
+    )),
+    ("mirror_axis", bpy.props.EnumProperty(
         items=[
             ('X', "X", "Mirror along the X axis"),
             ('Y', "Y", "Mirror along the Y axis"),
@@ -1236,20 +1483,56 @@ def register():
         name="Mirror Axis",
         description="The axis along which to mirror the objects",
         default='X'
-    )
-    bpy.types.Scene.mirror_center_object = bpy.props.PointerProperty(
+    )),
+    ("mirror_center_object", bpy.props.PointerProperty(
         name="Mirror Center Object",
         description="The object to use as the center for the mirror operation",
         type=bpy.types.Object
-    )
+    )),
+)
 
-    bpy.utils.register_class(OBJECT_UL_RefacetPresetsList)
+_WINDOW_MANAGER_PROPS = (
+    ("plasticity_busy", bpy.props.BoolProperty(name="Plasticity busy", default=False, options={'HIDDEN'})),
+    ("prop_plasticity_ui_tab", bpy.props.EnumProperty(
+        items=[
+            ("PINNED", "Pinned", "Pinned items only"),
+            ("MAIN", "Main", "Connection, live link, refresh, filters, scale"),
+            ("REFACET", "Refacet", "Refacet, presets, density/tolerance, live refacet"),
+            ("UTILITIES", "Utilities", "Selection, marking, and paint utilities"),
+            ("UV_TOOLS", "UV / Material / Texture Tools", "Unwrap, UV editor, UVs, materials, textures"),
+            ("MESH_TOOLS", "Mesh Tools", "Selection, joins, merge, mirror, modifiers, import/export"),
+            ("PREFERENCES", "Preferences", "General add-on behavior and workflow options"),
+        ],
+        name="Plasticity Tabs",
+        default="MAIN",
+    )),
+)
+
+_APP_HANDLERS = (
+    ("load_post", load_presets),
+    ("depsgraph_update_post", _on_mode_change),
+    ("depsgraph_update_post", _on_plasticity_pivot_update),
+)
+_INSTALLED_HANDLERS = set()
+
+def register():
+    print("Registering Plasticity client")
+    _register_classes()
+    bpy.types.Scene.refacet_presets = bpy.props.CollectionProperty(type=RefacetPreset)
+    bpy.types.Scene.active_refacet_preset_index = bpy.props.IntProperty(name="Active Preset", default=0)
 
-    bpy.app.handlers.load_post.append(load_presets)
-    if _on_mode_change not in bpy.app.handlers.depsgraph_update_post:
-        bpy.app.handlers.depsgraph_update_post.append(_on_mode_change)
-    if _on_plasticity_pivot_update not in bpy.app.handlers.depsgraph_update_post:
-        bpy.app.handlers.depsgraph_update_post.append(_on_plasticity_pivot_update)
+    bpy.types.VIEW3D_MT_edit_mesh_select_similar.append(select_similar)
+
+    for name, prop in _SCENE_PROPS:
+        setattr(bpy.types.Scene, name, prop)
+    for name, prop in _WINDOW_MANAGER_PROPS:
+        setattr(bpy.types.WindowManager, name, prop)
+
+    for list_name, fn in _APP_HANDLERS:
+        handler_list = getattr(bpy.app.handlers, list_name)
+        if fn not in handler_list:
+            handler_list.append(fn)
+        _INSTALLED_HANDLERS.add((list_name, fn))
 
     try:
         _initialize_checker_library()
@@ -1273,15 +1556,34 @@ def unregister():
     print("Unregistering Plasticity client")
     global _CHECKER_INIT_SCHEDULED
     global _LIVE_EXPAND_SYNC_SCHEDULED, _LIVE_EXPAND_SYNC_RETRIES_LEFT
+    global _PRESETS_LOAD_SCHEDULED, _PRESETS_LOAD_PENDING, _PRESETS_SAVE_SCHEDULED
+    timers = bpy.app.timers
+    scene_type = bpy.types.Scene
+    window_manager_type = bpy.types.WindowManager
+    if _PRESETS_SAVE_SCHEDULED:
+        try:
+            timers.unregister(_flush_presets)
+        except Exception:
+            pass
+        _PRESETS_SAVE_SCHEDULED = False
+    # Write out any edits still waiting on the debounce timer.
+    _flush_presets()
+    if _PRESETS_LOAD_SCHEDULED:
+        try:
+            timers.unregister(_run_presets_load_timer)
+        except Exception:
+            pass
+        _PRESETS_LOAD_SCHEDULED = False
+    _PRESETS_LOAD_PENDING = False
     if _CHECKER_INIT_SCHEDULED:
         try:
-            bpy.app.timers.unregister(_run_checker_init_timer)
+            timers.unregister(_run_checker_init_timer)
         except Exception:
             pass
         _CHECKER_INIT_SCHEDULED = False
     if _LIVE_EXPAND_SYNC_SCHEDULED:
         try:
-            bpy.app.timers.unregister(_run_live_expand_sync_timer)
+            timers.unregister(_run_live_expand_sync_timer)
         except Exception:
             pass
         _LIVE_EXPAND_SYNC_SCHEDULED = False
@@ -1291,217 +1593,34 @@ def unregister():
     operators.stop_live_paint_faces_timer()
     operators.stop_live_expand_overlay()
 
-    bpy.utils.unregister_class(ui.PlasticityPanel)
-    bpy.utils.unregister_class(ui.DisconnectButton)
-    bpy.utils.unregister_class(ui.ConnectButton)
-    bpy.utils.unregister_class(ui.ListButton)
-    bpy.utils.unregister_class(ui.SendToPlasticityButton)
-    bpy.utils.unregister_class(ui.SubscribeAllButton)
-    bpy.utils.unregister_class(ui.UnsubscribeAllButton)
-    bpy.utils.unregister_class(ui.RefacetButton)
-
-    bpy.utils.unregister_class(RefacetPreset)
-    bpy.utils.unregister_class(AddRefacetPresetOperator)
-    bpy.utils.unregister_class(RemoveRefacetPresetOperator)
-    del bpy.types.Scene.refacet_presets
-    del bpy.types.Scene.active_refacet_preset_index
-
-    bpy.utils.unregister_class(operators.SelectByFaceIDOperator)
-    bpy.utils.unregister_class(operators.SelectByFaceIDEdgeOperator)
-    bpy.utils.unregister_class(operators.AutoMarkEdgesOperator)
-    bpy.utils.unregister_class(operators.MergeUVSeams)
-    bpy.utils.unregister_class(operators.RelaxUVsPlasticityOperator)
-    bpy.utils.unregister_class(operators.AutoUnwrapPlasticityOperator)
-    bpy.utils.unregister_class(operators.PackUVIslandsPlasticityOperator)
-    bpy.utils.unregister_class(operators.ClearPlasticityFaceMaterialMappingOperator)
-    bpy.utils.unregister_class(operators.ReapplyPlasticityFaceMaterialMappingOperator)
-    bpy.utils.unregister_class(operators.CapturePlasticityFaceMaterialMappingOperator)
-    bpy.utils.unregister_class(operators.PaintPlasticityFacesOperator)
-    bpy.utils.unregister_class(operators.SimilarGeometrySelector)
-    bpy.utils.unregister_class(operators.SelectedJoiner)
-    bpy.utils.unregister_class(operators.SelectedUnjoiner)
-    bpy.utils.unregister_class(operators.NonOverlappingMeshesMerger)
-    bpy.utils.unregister_class(operators.OpenUVEditorOperator)
-    bpy.utils.unregister_class(operators.CloseUVEditorOperator)
-    bpy.utils.unregister_class(operators.MaterialRemover)
-    bpy.utils.unregister_class(operators.AssignUVCheckerTextureOperator)
-    bpy.utils.unregister_class(operators.SelectCheckerImageOperator)
-    bpy.utils.unregister_class(operators.RemoveUVCheckerNodesOperator)
-    bpy.utils.unregister_class(operators.TextureReloader)
-    bpy.utils.unregister_class(operators.ImportFBXOperator)
-    bpy.utils.unregister_class(operators.ExportFBXOperator)
-    bpy.utils.unregister_class(operators.ImportOBJOperator)
-    bpy.utils.unregister_class(operators.ExportOBJOperator)
-    bpy.utils.unregister_class(operators.MirrorOperator)
-    bpy.utils.unregister_class(operators.RemoveModifiers)
-    bpy.utils.unregister_class(operators.ApplyModifiers)
-    bpy.utils.unregister_class(operators.RemoveVertexGroups)
-    bpy.utils.unregister_class(operators.SnapToCursorOperator)
-    bpy.utils.unregister_class(operators.SelectMeshesWithNgons)
-    bpy.utils.unregister_class(operators.SelectObjectsWithoutUVs)
-    bpy.utils.unregister_class(operators.RemoveUVsFromSelectedObjects)
+    for name in ("refacet_presets", "active_refacet_preset_index"):
+        with contextlib.suppress(AttributeError):
+            delattr(scene_type, name)
     operators.clear_checker_previews()
+    operators.clear_operator_caches()
+    _unregister_classes()
+
+    try:
+        bpy.types.VIEW3D_MT_edit_mesh_select_similar.remove(select_similar)
+    except ValueError:
+        pass
+
+    handlers = bpy.app.handlers
+    for list_name, fn in _APP_HANDLERS:
+        if (list_name, fn) not in _INSTALLED_HANDLERS:
+            continue
+        _INSTALLED_HANDLERS.discard((list_name, fn))
+        try:
+            getattr(handlers, list_name).remove(fn)
+        except ValueError:
+            pass
 
-    bpy.types.VIEW3D_MT_edit_mesh_select_similar.remove(select_similar)
-
-    bpy.utils.unregister_class(OBJECT_UL_RefacetPresetsList)
-
-    bpy.app.handlers.load_post.remove(load_presets)
-    if _on_mode_change in bpy.app.handlers.depsgraph_update_post:
-        bpy.app.handlers.depsgraph_update_post.remove(_on_mode_change)
-    if _on_plasticity_pivot_update in bpy.app.handlers.depsgraph_update_post:
-        bpy.app.handlers.depsgraph_update_post.remove(_on_plasticity_pivot_update)
-
-    del bpy.types.Scene.prop_plasticity_server
-    del bpy.types.Scene.prop_plasticity_facet_tolerance
-    del bpy.types.Scene.prop_plasticity_facet_angle
-    del bpy.types.Scene.prop_plasticity_facet_density
-    del bpy.types.Scene.prop_plasticity_facet_tri_or_ngon
-    del bpy.types.Scene.prop_plasticity_select_adjacent_fillets
-    del bpy.types.Scene.prop_plasticity_select_fillet_min_curvature_angle
-    del bpy.types.Scene.prop_plasticity_select_fillet_max_area_ratio
-    del bpy.types.Scene.prop_plasticity_select_fillet_min_adjacent_groups
-    del bpy.types.Scene.prop_plasticity_select_include_vertex_adjacency
-    del bpy.types.Scene.prop_plasticity_select_vertex_adjacent_max_length_ratio
-    del bpy.types.Scene.prop_plasticity_live_expand
-    del bpy.types.Scene.prop_plasticity_live_expand_auto_circle
-    del bpy.types.Scene.prop_plasticity_live_expand_auto_select_cylinders
-    del bpy.types.Scene.prop_plasticity_live_expand_cylinder_min_wrap_angle
-    del bpy.types.Scene.prop_plasticity_live_expand_edge_highlight
-    del bpy.types.Scene.prop_plasticity_live_expand_active_view_only
-    del bpy.types.Scene.prop_plasticity_live_expand_interval
-    del bpy.types.Scene.prop_plasticity_live_expand_auto_merge_seams
-    del bpy.types.Scene.prop_plasticity_auto_seam_mode
-    del bpy.types.Scene.prop_plasticity_auto_cylinder_seam_mode
-    del bpy.types.Scene.prop_plasticity_auto_cylinder_partial_angle
-    del bpy.types.Scene.prop_plasticity_auto_cylinder_seam_occluded_only
-    del bpy.types.Scene.prop_plasticity_live_expand_edge_thickness
-    del bpy.types.Scene.prop_plasticity_live_expand_edge_occlude
-    del bpy.types.Scene.prop_plasticity_live_expand_overlay_color
-    del bpy.types.Scene.prop_plasticity_list_only_visible
-    del bpy.types.Scene.prop_plasticity_list_only_selected
-    del bpy.types.Scene.prop_plasticity_list_only_new
-    del bpy.types.Scene.prop_plasticity_send_create_subd
-    del bpy.types.Scene.prop_plasticity_send_rounded_corners
-    del bpy.types.Scene.prop_plasticity_send_merge_patches
-    del bpy.types.Scene.prop_plasticity_send_interpolate_boundary
-    del bpy.types.Scene.prop_plasticity_ui_show_advanced_facet
-    del bpy.types.Scene.prop_plasticity_ui_show_refacet
-    del bpy.types.Scene.prop_plasticity_live_refacet
-    del bpy.types.Scene.prop_plasticity_live_refacet_only_selected
-    del bpy.types.Scene.prop_plasticity_live_refacet_interval
-    del bpy.types.Scene.prop_plasticity_ui_tab
-    del bpy.types.Scene.prop_plasticity_ui_show_utilities
-    del bpy.types.Scene.prop_plasticity_ui_util_auto_mark_edges
-    del bpy.types.Scene.prop_plasticity_ui_util_merge_uv_seams
-    del bpy.types.Scene.prop_plasticity_ui_util_select_faces
-    del bpy.types.Scene.prop_plasticity_ui_util_select_edges
-    del bpy.types.Scene.prop_plasticity_ui_util_paint_faces
-    del bpy.types.Scene.prop_plasticity_paint_faces_mode
-    del bpy.types.Scene.prop_plasticity_paint_faces_attribute_name
-    del bpy.types.Scene.prop_plasticity_live_paint_faces
-    del bpy.types.Scene.prop_plasticity_ui_util_highlight
-    del bpy.types.Scene.prop_plasticity_ui_show_uv_tools
-    del bpy.types.Scene.prop_plasticity_ui_show_mesh_tools
-    del bpy.types.Scene.prop_plasticity_object_transform_control_mode
-    del bpy.types.Scene.prop_plasticity_pin_live_link
-    del bpy.types.Scene.prop_plasticity_pin_refresh
-    del bpy.types.Scene.prop_plasticity_pin_only_visible
-    del bpy.types.Scene.prop_plasticity_pin_only_selected
-    del bpy.types.Scene.prop_plasticity_pin_only_new
-    del bpy.types.Scene.prop_plasticity_pin_scale
-    del bpy.types.Scene.prop_plasticity_pin_send_to_plasticity
-    del bpy.types.Scene.prop_plasticity_pin_send_create_subd
-    del bpy.types.Scene.prop_plasticity_pin_send_rounded_corners
-    del bpy.types.Scene.prop_plasticity_pin_send_merge_patches
-    del bpy.types.Scene.prop_plasticity_pin_send_interpolate_boundary
-    del bpy.types.Scene.prop_plasticity_pin_refacet
-    del bpy.types.Scene.prop_plasticity_pin_live_refacet_only_selected
-    del bpy.types.Scene.prop_plasticity_pin_live_refacet
-    del bpy.types.Scene.prop_plasticity_pin_auto_mark_edges
-    del bpy.types.Scene.prop_plasticity_pin_merge_uv_seams
-    del bpy.types.Scene.prop_plasticity_pin_select_faces
-    del bpy.types.Scene.prop_plasticity_pin_select_edges
-    del bpy.types.Scene.prop_plasticity_pin_paint_faces
-    del bpy.types.Scene.prop_plasticity_pin_paint_faces_mode
-    del bpy.types.Scene.prop_plasticity_pin_paint_faces_attribute_name
-    del bpy.types.Scene.prop_plasticity_pin_live_paint_faces
-    del bpy.types.Scene.prop_plasticity_pin_live_expand
-    del bpy.types.Scene.prop_plasticity_pin_live_expand_auto_circle
-    del bpy.types.Scene.prop_plasticity_pin_live_expand_auto_select_cylinders
-    del bpy.types.Scene.prop_plasticity_pin_live_expand_cylinder_min_wrap_angle
-    del bpy.types.Scene.prop_plasticity_pin_live_expand_interval
-    del bpy.types.Scene.prop_plasticity_pin_live_expand_auto_merge_seams
-    del bpy.types.Scene.prop_plasticity_pin_auto_seam_mode
-    del bpy.types.Scene.prop_plasticity_pin_auto_cylinder_seam_mode
-    del bpy.types.Scene.prop_plasticity_pin_auto_cylinder_partial_angle
-    del bpy.types.Scene.prop_plasticity_pin_auto_cylinder_seam_occluded_only
-    del bpy.types.Scene.prop_plasticity_pin_relax_uvs
-    del bpy.types.Scene.prop_plasticity_pin_select_adjacent_fillets
-    del bpy.types.Scene.prop_plasticity_pin_select_fillet_min_curvature_angle
-    del bpy.types.Scene.prop_plasticity_pin_select_fillet_max_area_ratio
-    del bpy.types.Scene.prop_plasticity_pin_select_fillet_min_adjacent_groups
-    del bpy.types.Scene.prop_plasticity_pin_select_include_vertex_adjacency
-    del bpy.types.Scene.prop_plasticity_pin_select_vertex_adjacent_max_length_ratio
-    del bpy.types.Scene.prop_plasticity_pin_live_expand_edge_highlight
-    del bpy.types.Scene.prop_plasticity_pin_live_expand_active_view_only
-    del bpy.types.Scene.prop_plasticity_pin_live_expand_edge_occlude
-    del bpy.types.Scene.prop_plasticity_pin_live_expand_edge_thickness
-    del bpy.types.Scene.prop_plasticity_pin_live_expand_overlay_color
-    del bpy.types.Scene.prop_plasticity_pin_uv_unwrap
-    del bpy.types.Scene.prop_plasticity_pin_uv_pack_islands
-    del bpy.types.Scene.prop_plasticity_pin_uv_open_editor
-    del bpy.types.Scene.prop_plasticity_pin_uv_close_editor
-    del bpy.types.Scene.prop_plasticity_pin_uv_select_without_uvs
-    del bpy.types.Scene.prop_plasticity_pin_uv_remove_uvs
-    del bpy.types.Scene.prop_plasticity_pin_uv_remove_materials
-    del bpy.types.Scene.prop_plasticity_pin_uv_reload_textures
-    del bpy.types.Scene.prop_plasticity_pin_uv_assign_checker
-    del bpy.types.Scene.prop_plasticity_pin_uv_remove_checker
-    del bpy.types.Scene.prop_plasticity_pin_mesh_select_similar
-    del bpy.types.Scene.prop_plasticity_pin_mesh_object_transform_control_mode
-    del bpy.types.Scene.prop_plasticity_pin_mesh_join
-    del bpy.types.Scene.prop_plasticity_pin_mesh_unjoin
-    del bpy.types.Scene.prop_plasticity_pin_mesh_merge_nonoverlapping
-    del bpy.types.Scene.prop_plasticity_pin_mesh_overlap_threshold
-    del bpy.types.Scene.prop_plasticity_pin_mesh_select_ngons
-    del bpy.types.Scene.prop_plasticity_pin_mesh_mirror
-    del bpy.types.Scene.prop_plasticity_pin_mesh_mirror_axis
-    del bpy.types.Scene.prop_plasticity_pin_mesh_mirror_center
-    del bpy.types.Scene.prop_plasticity_pin_mesh_remove_modifiers
-    del bpy.types.Scene.prop_plasticity_pin_mesh_apply_modifiers
-    del bpy.types.Scene.prop_plasticity_pin_mesh_remove_vertex_groups
-    del bpy.types.Scene.prop_plasticity_pin_mesh_snap_cursor
-    del bpy.types.Scene.prop_plasticity_pin_mesh_import_fbx
-    del bpy.types.Scene.prop_plasticity_pin_mesh_export_fbx
-    del bpy.types.Scene.prop_plasticity_pin_mesh_import_obj
-    del bpy.types.Scene.prop_plasticity_pin_mesh_export_obj
-    del bpy.types.Scene.prop_plasticity_checker_source
-    del bpy.types.Scene.prop_plasticity_checker_image
-    del bpy.types.Scene.prop_plasticity_pref_auto_assign_checker_on_select
-    del bpy.types.Scene.prop_plasticity_pref_fbx_export_backend
-    del bpy.types.Scene.prop_plasticity_checker_custom_path
-    del bpy.types.Scene.prop_plasticity_facet_min_width
-    del bpy.types.Scene.prop_plasticity_facet_max_width
-    del bpy.types.Scene.prop_plasticity_facet_min_width_enabled
-    del bpy.types.Scene.prop_plasticity_facet_max_width_enabled
-    del bpy.types.Scene.prop_plasticity_unit_scale
-    del bpy.types.Scene.prop_plasticity_surface_angle_tolerance
-    del bpy.types.Scene.mark_seam
-    del bpy.types.Scene.mark_sharp
-    del bpy.types.WindowManager.plasticity_busy
-    del bpy.types.Scene.prop_plasticity_curve_chord_tolerance
-    del bpy.types.Scene.prop_plasticity_curve_angle_tolerance
-    del bpy.types.Scene.prop_plasticity_surface_plane_tolerance
-    del bpy.types.Scene.prop_plasticity_plane_angle
-    del bpy.types.Scene.prop_plasticity_convex_ngons_only
-    del bpy.types.Scene.prop_plasticity_curve_max_length_enabled
-    del bpy.types.Scene.prop_plasticity_curve_max_length
-    del bpy.types.Scene.prop_plasticity_relative_to_bbox
-    del bpy.types.Scene.prop_plasticity_match_topology
-    del bpy.types.Scene.overlap_threshold
-    del bpy.types.Scene.mirror_axis
-    del bpy.types.Scene.mirror_center_object
+    for name, _prop in _SCENE_PROPS:
+        with contextlib.suppress(AttributeError):
+            delattr(scene_type, name)
+    for name, _prop in _WINDOW_MANAGER_PROPS:
+        with contextlib.suppress(AttributeError):
+            delattr(window_manager_type, name)
 
 
 
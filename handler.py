@@ -17,6 +17,7 @@ _PIVOT_MATRIX_EPS = 1.0e-6
 _PIVOT_CORNER_EPS = 1.0e-4
 _PIVOT_MODE_PLASTICITY = "PLASTICITY"
 _PIVOT_MODE_BLENDER = "BLENDER"
+_UNLINK_SCAN_MIN_OBJECTS = 16
 
 
 def _is_plasticity_mesh_object(obj):
@@ -157,6 +158,51 @@ def _bbox_center_from_object(obj):
     return total / count
 
 
+_TRI_LOOP_STARTS = np.empty(0, dtype=np.int32)
+_TRI_LOOP_TOTALS = np.empty(0, dtype=np.int32)
+
+
+def _tri_loop_buffers(tri_count):
+    # Shared loop_start/loop_total arrays for all-triangle meshes. They only
+    # grow; callers get views of the first tri_count entries and must not
+    # write to them.
+    global _TRI_LOOP_STARTS, _TRI_LOOP_TOTALS
+    if _TRI_LOOP_TOTALS.size < tri_count:
+        size = max(tri_count, _TRI_LOOP_TOTALS.size * 2)
+        _TRI_LOOP_STARTS = np.arange(0, size * 3, 3, dtype=np.int32)
+        _TRI_LOOP_TOTALS = np.full(size, 3, dtype=np.int32)
+    return _TRI_LOOP_STARTS[:tri_count], _TRI_LOOP_TOTALS[:tri_count]
+
+
+def _clear_mesh_layers(mesh):
+    # Drop what clear_geometry() would: UV maps, material indices, sharp/crease
+    # flags, selection and any user attributes. Only topology and positions
+    # are kept.
+    names = [attr.name for attr in mesh.attributes if not attr.is_required]
+    attributes = mesh.attributes
+    for name in names:
+        attr = attributes.get(name)
+        if attr is None:
+            continue
+        try:
+            attributes.remove(attr)
+        except Exception:
+            pass
+    edge_count = len(mesh.edges)
+    if edge_count:
+        mesh.edges.foreach_set("use_seam", np.zeros(edge_count, dtype=bool))
+
+
+_SMOOTH_FLAGS = np.empty(0, dtype=bool)
+
+
+def _smooth_flags(poly_count):
+    global _SMOOTH_FLAGS
+    if _SMOOTH_FLAGS.size < poly_count:
+        _SMOOTH_FLAGS = np.ones(max(poly_count, _SMOOTH_FLAGS.size * 2), dtype=bool)
+    return _SMOOTH_FLAGS[:poly_count]
+
+
 class PlasticityIdUniquenessScope(Enum):
     ITEM = 0
     GROUP = 1
@@ -663,17 +709,14 @@ class SceneHandler:
         mesh.vertices.foreach_set("co", verts)
         mesh.loops.add(len(indices))
         mesh.loops.foreach_set("vertex_index", indices)
-        mesh.polygons.add(len(indices) // 3)
-        mesh.polygons.foreach_set("loop_total", np.full(
-            len(indices) // 3, 3, dtype=np.int32))
-        mesh.polygons.foreach_set("loop_start", np.arange(
-            0, len(indices), 3, dtype=np.int32))
-
-        # NOTE: As of blender 4.2, the concrete type of user attributes cannot be numpy arrays.
-        assert isinstance(groups, list)
-        assert isinstance(face_ids, list)
+        tri_count = len(indices) // 3
+        loop_start, loop_total = _tri_loop_buffers(tri_count)
+        mesh.polygons.add(tri_count)
+        mesh.polygons.foreach_set("loop_total", loop_total)
+        mesh.polygons.foreach_set("loop_start", loop_start)
+
         _apply_plasticity_groups_and_normals(
-            mesh, indices, normals, groups, face_ids)
+            mesh, indices, normals, groups, face_ids, (loop_start, loop_total))
 
         return mesh
 
@@ -705,26 +748,44 @@ class SceneHandler:
         verts, normals, compensation = self.__pivot_prepare_import_geometry(obj, verts, normals, scene=scene)
 
         mesh = obj.data
-        mesh.clear_geometry()
+        tri_count = len(indices) // 3
+        loop_start, loop_total = _tri_loop_buffers(tri_count)
+
+        # Live-link moves usually resend the same triangles; then the topology can
+        # stay and only the positions and layers need resetting. Vertex weights and
+        # shape keys have no cheap reset, so meshes with them are rebuilt.
+        same_topology = (
+            not obj.vertex_groups
+            and mesh.shape_keys is None
+            and len(mesh.vertices) * 3 == len(verts)
+            and len(mesh.loops) == len(indices)
+            and len(mesh.polygons) == tri_count
+        )
+        if same_topology:
+            current_indices = np.empty(len(indices), dtype=np.int32)
+            mesh.loops.foreach_get("vertex_index", current_indices)
+            same_topology = np.array_equal(current_indices, indices)
+
+        if same_topology:
+            _clear_mesh_layers(mesh)
+            mesh.vertices.foreach_set("co", verts)
+        else:
+            mesh.clear_geometry()
 
-        mesh.vertices.add(len(verts) // 3)
-        mesh.vertices.foreach_set("co", verts)
+            mesh.vertices.add(len(verts) // 3)
+            mesh.vertices.foreach_set("co", verts)
 
-        mesh.loops.add(len(indices))
-        mesh.loops.foreach_set("vertex_index", indices)
+            mesh.loops.add(len(indices))
+            mesh.loops.foreach_set("vertex_index", indices)
 
-        mesh.polygons.add(len(indices) // 3)
-        mesh.polygons.foreach_set("loop_start", range(0, len(indices), 3))
-        mesh.polygons.foreach_set("loop_total", [3] * (len(indices) // 3))
+            mesh.polygons.add(tri_count)
+            mesh.polygons.foreach_set("loop_start", loop_start)
+            mesh.polygons.foreach_set("loop_total", loop_total)
 
-        # NOTE: As of blender 4.2, the concrete type of user attributes cannot be numpy arrays.
-        assert isinstance(groups, list)
-        assert isinstance(face_ids, list)
         _apply_plasticity_groups_and_normals(
-            mesh, indices, normals, groups, face_ids)
+            mesh, indices, normals, groups, face_ids, (loop_start, loop_total))
 
         self.__pivot_apply_rebuild_state(obj, compensation=compensation)
-        self.update_pivot(obj)
         self.__pivot_track_object(obj)
 
     def __update_mesh_ngons(self, obj, version, faces, verts, indices, normals, groups, face_ids):
@@ -755,10 +816,17 @@ class SceneHandler:
         mesh = obj.data
         mesh.clear_geometry()
 
-        verts_array = np.array(verts).reshape(-1, 3)
-        unique_verts, inverse_indices = np.unique(
-            verts_array, axis=0, return_inverse=True)
-        new_indices = inverse_indices[indices]
+        # Adding 0.0 folds -0.0 into 0.0 so the byte-wise row compare below
+        # matches the value compare np.unique(axis=0) used to do.
+        verts_array = np.ascontiguousarray(
+            np.asarray(verts, dtype=np.float32).reshape(-1, 3) + np.float32(0.0))
+        row_view = verts_array.view(
+            np.dtype((np.void, verts_array.dtype.itemsize * 3))).ravel()
+        _, unique_index, inverse_indices = np.unique(
+            row_view, return_index=True, return_inverse=True)
+        unique_verts = verts_array[unique_index]
+        inverse_indices = inverse_indices.ravel().astype(np.int32, copy=False)
+        new_indices = inverse_indices[np.asarray(indices, dtype=np.int32)]
 
         mesh.vertices.add(len(unique_verts))
         mesh.vertices.foreach_set("co", unique_verts.ravel())
@@ -767,53 +835,34 @@ class SceneHandler:
         mesh.loops.foreach_set("vertex_index", new_indices)
 
         if (len(faces) == 0):
-            mesh.polygons.add(len(new_indices) // 3)
-            mesh.polygons.foreach_set(
-                "loop_start", range(0, len(new_indices), 3))
-            mesh.polygons.foreach_set(
-                "loop_total", [3] * (len(new_indices) // 3))
+            tri_count = len(new_indices) // 3
+            loop_start, loop_total = _tri_loop_buffers(tri_count)
+            mesh.polygons.add(tri_count)
+            mesh.polygons.foreach_set("loop_start", loop_start)
+            mesh.polygons.foreach_set("loop_total", loop_total)
         else:
-            # Find where a new face/polygon starts (value changes in the array)
-            diffs = np.where(np.diff(faces))[0] + 1
-            # Insert the starting index for the first polygon
-            loop_start = np.insert(diffs, 0, 0)
-            # Calculate the number of vertices per polygon
-            loop_total = np.append(np.diff(loop_start), [
-                                   len(faces) - loop_start[-1]])
-            mesh.polygons.add(len(loop_start))
+            # Find where a new face/polygon starts (value changes in the array);
+            # the trailing entry is a sentinel so np.diff yields every loop_total.
+            faces_array = np.asarray(faces)
+            diffs = np.flatnonzero(np.diff(faces_array))
+            poly_count = diffs.size + 1
+            bounds = np.empty(poly_count + 1, dtype=np.int32)
+            bounds[0] = 0
+            np.add(diffs, 1, out=bounds[1:poly_count], casting='unsafe')
+            bounds[poly_count] = faces_array.size
+            loop_start = bounds[:poly_count]
+            loop_total = np.diff(bounds)
+            mesh.polygons.add(poly_count)
             mesh.polygons.foreach_set("loop_start", loop_start)
             mesh.polygons.foreach_set("loop_total", loop_total)
             # NOTE: safe_loop_normals happens after group validation.
 
-        # NOTE: As of blender 4.2, the concrete type of user attributes cannot be numpy arrays.
-        assert isinstance(groups, list)
-        assert isinstance(face_ids, list)
         _apply_plasticity_groups_and_normals(
-            mesh, indices, normals, groups, face_ids)
+            mesh, indices, normals, groups, face_ids, (loop_start, loop_total))
 
         self.__pivot_apply_rebuild_state(obj, compensation=compensation)
-        self.update_pivot(obj)
         self.__pivot_track_object(obj)
 
-    def update_pivot(self, obj):
-        # NOTE: this doesn't work unfortunately. It seems like changing matrix_world or matrix_local
-        # is only possible in special contexts that I cannot yet figure out.
-        return
-        if not "plasticity_transform" in obj:
-            return
-        transform_list = obj["plasticity_transform"]
-        if transform_list is not None:
-            bpy.context.view_layer.objects.active = obj
-            obj.select_set(True)
-            bpy.ops.object.mode_set(mode='OBJECT')
-            old_matrix_world = obj.matrix_world.copy()
-            transform = np.array(transform_list).reshape(4, 4)
-            obj.matrix_world = mathutils.Matrix(transform)
-            obj.matrix_world.invert()
-            bpy.ops.object.transform_apply(
-                location=True, rotation=True, scale=True)
-            obj.matrix_world = old_matrix_world
-
     def __add_object(self, filename, object_type, plasticity_id, name, mesh):
         mesh_obj = bpy.data.objects.new(name, mesh)
         self.files[filename][PlasticityIdUniquenessScope.ITEM][plasticity_id] = mesh_obj
@@ -856,6 +905,7 @@ class SceneHandler:
         outbox_ids = self.__get_outbox_plasticity_ids(filename)
 
         collections_to_unlink = set()
+        objects_to_unlink = set()
 
         for item in objects:
             object_type = item['type']
@@ -890,8 +940,7 @@ class SceneHandler:
                     if obj:
                         self.__update_object_and_mesh(
                             obj, object_type, version, name, verts, faces, normals, groups, face_ids)
-                        for parent in obj.users_collection:
-                            parent.objects.unlink(obj)
+                        objects_to_unlink.add(obj)
 
             elif object_type == ObjectType.GROUP.value:
                 if plasticity_id > 0:
@@ -908,11 +957,34 @@ class SceneHandler:
                         collections_to_unlink.add(group_collection)
 
 
-        # Unlink all mirrored collections, in case they have moved. It doesn't seem like there is a more efficient way to do this??
-        for potential_parent in bpy.data.collections:
-            to_unlink = [
-                child for child in potential_parent.children if child in collections_to_unlink]
-            for child in to_unlink:
+        # Unlink updated objects from every collection, in case they have moved.
+        # Object.users_collection scans all collections on each access, which is
+        # fine for a few objects; larger batches map every object's parents in a
+        # single scan instead. Both remove the same links.
+        if len(objects_to_unlink) < _UNLINK_SCAN_MIN_OBJECTS:
+            object_parents = {obj: tuple(obj.users_collection) for obj in objects_to_unlink}
+        else:
+            object_parents = defaultdict(list)
+            parents = list(bpy.data.collections)
+            parents.extend(blend_scene.collection for blend_scene in bpy.data.scenes)
+            for parent in parents:
+                for obj in parent.objects:
+                    if obj in objects_to_unlink:
+                        object_parents[obj].append(parent)
+        for obj, obj_parents in object_parents.items():
+            for parent in obj_parents:
+                parent.objects.unlink(obj)
+
+        # Unlink all mirrored collections, in case they have moved. Collections have no
+        # parent accessor, so collect every (parent, child) link in one pass first.
+        if collections_to_unlink:
+            links = [
+                (potential_parent, child)
+                for potential_parent in bpy.data.collections
+                for child in potential_parent.children
+                if child in collections_to_unlink
+            ]
+            for potential_parent, child in links:
                 potential_parent.children.unlink(child)
 
         for item in objects:
@@ -967,11 +1039,8 @@ class SceneHandler:
             filename_collection = bpy.data.collections.new(filename)
             plasticity_collection.children.link(filename_collection)
 
-        inbox_collections = [
-            child for child in filename_collection.children if "inbox" in child]
-        inbox_collection = None
-        if len(inbox_collections) > 0:
-            inbox_collection = inbox_collections[0]
+        inbox_collection = next(
+            (child for child in filename_collection.children if "inbox" in child), None)
         if not inbox_collection:
             inbox_collection = bpy.data.collections.new("Inbox")
             filename_collection.children.link(inbox_collection)
@@ -989,11 +1058,8 @@ class SceneHandler:
             filename_collection = bpy.data.collections.new(filename)
             plasticity_collection.children.link(filename_collection)
 
-        outbox_collections = [
-            child for child in filename_collection.children if "outbox" in child]
-        outbox_collection = None
-        if len(outbox_collections) > 0:
-            outbox_collection = outbox_collections[0]
+        outbox_collection = next(
+            (child for child in filename_collection.children if "outbox" in child), None)
         if not outbox_collection:
             outbox_collection = bpy.data.collections.new("Outbox")
             filename_collection.children.link(outbox_collection)
@@ -1048,18 +1114,16 @@ class SceneHandler:
             positions = positions.reshape(-1, 3)
             positions = (positions @ matrix[:3, :3].T + matrix[:3, 3]).flatten().astype(np.float32)
 
-            indices = []
-            sizes = []
-            for poly in mesh.polygons:
-                sizes.append(poly.loop_total)
-                for loop_idx in range(poly.loop_start, poly.loop_start + poly.loop_total):
-                    indices.append(mesh.loops[loop_idx].vertex_index)
+            loop_vertex_indices = np.empty(len(mesh.loops), dtype=np.int32)
+            mesh.loops.foreach_get("vertex_index", loop_vertex_indices)
+            loop_start, loop_total = _read_poly_loops(mesh)
+            indices = loop_vertex_indices[_expand_spans(loop_start, loop_total)]
 
             return {
                 "options": options,
                 "positions": positions,
-                "indices": np.array(indices, dtype=np.uint32),
-                "sizes": np.array(sizes, dtype=np.uint32),
+                "indices": indices.astype(np.uint32),
+                "sizes": loop_total.astype(np.uint32),
             }
         finally:
             if evaluated_obj is not None and mesh is not None:
@@ -1138,15 +1202,8 @@ class SceneHandler:
         inbox_collection = self.__inbox_for_filename(filename)
         self.__outbox_for_filename(filename)
 
-        def gather_items(collection):
-            objects = list(collection.objects)
-            collections = list(collection.children)
-            for sub_collection in collection.children:
-                subobjects, subcollections = gather_items(sub_collection)
-                objects.extend(subobjects)
-                collections.extend(subcollections)
-            return objects, collections
-        objects, collections = gather_items(inbox_collection)
+        objects = inbox_collection.all_objects
+        collections = inbox_collection.children_recursive
 
         existing_objects = {
             PlasticityIdUniquenessScope.ITEM: {},
@@ -1252,29 +1309,27 @@ class SceneHandler:
                     self.__replace_objects(filename, inbox_collection,
                                            version, filtered_items)
             else:
+                group_type = ObjectType.GROUP.value
+                mesh_types = {ObjectType.SOLID.value, ObjectType.SHEET.value}
                 all_items = set()
                 all_groups = set()
-                for item in add_items + update_items:
-                    if item["type"] == ObjectType.GROUP.value:
-                        all_groups.add(item["id"])
-                    else:
-                        all_items.add(item["id"])
-
-                if selected_only:
-                    filtered_add = [
-                        item for item in add_items
-                        if item["type"] == ObjectType.GROUP.value or item["id"] in filter_ids
-                    ]
-                    filtered_update = [
-                        item for item in update_items
-                        if item["type"] == ObjectType.GROUP.value or item["id"] in filter_ids
-                    ]
-                else:
-                    filtered_add = add_items
-                    filtered_update = update_items
+                changed_ids = set()
+                filtered_add = []
+                filtered_update = []
+                for items, filtered_items in ((add_items, filtered_add), (update_items, filtered_update)):
+                    for item in items:
+                        object_type = item["type"]
+                        plasticity_id = item["id"]
+                        if object_type == group_type:
+                            all_groups.add(plasticity_id)
+                        else:
+                            all_items.add(plasticity_id)
+                            if selected_only and plasticity_id not in filter_ids:
+                                continue
+                            if object_type in mesh_types:
+                                changed_ids.add(int(plasticity_id))
+                        filtered_items.append(item)
 
-                changed_ids = self.__mesh_item_ids(filtered_add)
-                changed_ids.update(self.__mesh_item_ids(filtered_update))
                 try:
                     from . import operators
                     operators.note_live_link_update(filename, changed_ids=changed_ids)
@@ -1349,13 +1404,16 @@ class SceneHandler:
         prev_selected_objects = bpy.context.selected_objects
 
         total = len(plasticity_ids)
+        window_manager = bpy.context.window_manager
+        status_interval = self._status_min_interval
         if total:
             self._update_status_text(
                 f"Progress: 0% (Refacet 0/{total})",
                 force=True,
             )
+            window_manager.progress_begin(0, total)
         try:
-            for i in range(len(plasticity_ids)):
+            for i in range(total):
                 plasticity_id = plasticity_ids[i]
                 version = versions[i]
                 face = faces[i] if len(faces) > 0 else None
@@ -1370,13 +1428,16 @@ class SceneHandler:
                 if obj:
                     self.__update_mesh_ngons(
                         obj, version, face, position, index, normal, group, face_id)
-                if total:
+                window_manager.progress_update(i + 1)
+                # Check the throttle here so skipped updates cost no formatting.
+                if time.monotonic() - self._last_status_time >= status_interval:
                     percent = int(((i + 1) / total) * 100)
                     self._update_status_text(
                         f"Progress: {percent}% (Refacet {i + 1}/{total})",
                     )
         finally:
             if total:
+                window_manager.progress_end()
                 self._update_status_text(None, force=True)
 
         changed_ids = self.__coerce_plasticity_id_set(plasticity_ids)
@@ -1493,18 +1554,14 @@ _PLASTICITY_FACE_ID_ATTR = "_plasticity_face_id_tmp"
 
 
 def _group_index_mode_for_mesh(groups, mesh):
-    if not groups:
+    if len(groups) == 0:
         return "loops"
-    counts_total = 0
-    max_end = 0
-    group_len = len(groups)
-    for idx in range(0, group_len, 2):
-        start = int(groups[idx])
-        count = int(groups[idx + 1]) if idx + 1 < group_len else 0
-        counts_total += count
-        end = start + count
-        if end > max_end:
-            max_end = end
+    values = np.asarray(groups, dtype=np.int64)
+    starts = values[0::2]
+    counts = np.zeros(starts.size, dtype=np.int64)
+    counts[:values.size // 2] = values[1::2]
+    counts_total = int(counts.sum())
+    max_end = max(int((starts + counts).max()), 0)
     if max_end <= len(mesh.polygons):
         return "faces"
     if max_end <= len(mesh.loops):
@@ -1516,96 +1573,119 @@ def _group_index_mode_for_mesh(groups, mesh):
     return "loops"
 
 
-def _build_loop_face_ids(mesh, groups, face_ids):
-    if not groups or not face_ids:
-        return []
+def _expand_spans(starts, lengths):
+    # Flat element indices covered by the [start, start + length) spans.
+    total = int(lengths.sum())
+    offsets = np.cumsum(lengths) - lengths
+    return np.arange(total, dtype=np.int64) + np.repeat(starts - offsets, lengths)
+
+
+def _clipped_group_spans(groups, face_ids, limit):
+    group_count = min(len(groups) // 2, len(face_ids))
+    pairs = np.asarray(groups, dtype=np.int64)[:group_count * 2].reshape(-1, 2)
+    ids = np.asarray(face_ids, dtype=np.int32)[:group_count]
+    starts = pairs[:, 0]
+    counts = pairs[:, 1]
+    ends = np.minimum(starts + counts, limit)
+    valid = (counts > 0) & (starts >= 0) & (ends > starts)
+    starts = starts[valid]
+    return starts, ends[valid] - starts, ids[valid]
+
+
+def _read_poly_loops(mesh):
+    face_count = len(mesh.polygons)
+    poly_loop_start = np.empty(face_count, dtype=np.int32)
+    poly_loop_total = np.empty(face_count, dtype=np.int32)
+    mesh.polygons.foreach_get("loop_start", poly_loop_start)
+    mesh.polygons.foreach_get("loop_total", poly_loop_total)
+    return poly_loop_start, poly_loop_total
+
+
+def _build_loop_face_ids(mesh, groups, face_ids, poly_loops=None):
+    if len(groups) == 0 or len(face_ids) == 0:
+        return None
     loop_count = len(mesh.loops)
     if loop_count == 0:
-        return []
-    loop_face_ids = [-1] * loop_count
-    group_count = min(len(groups) // 2, len(face_ids))
+        return None
+    loop_face_ids = np.full(loop_count, -1, dtype=np.int32)
     mode = _group_index_mode_for_mesh(groups, mesh)
 
     if mode == "faces":
         face_count = len(mesh.polygons)
-        for group_idx in range(group_count):
-            start = int(groups[group_idx * 2])
-            count = int(groups[group_idx * 2 + 1])
-            if count <= 0 or start < 0:
-                continue
-            end = min(start + count, face_count)
-            face_id = int(face_ids[group_idx])
-            for face_index in range(start, end):
-                poly = mesh.polygons[face_index]
-                loop_start = poly.loop_start
-                loop_end = loop_start + poly.loop_total
-                for loop_index in range(loop_start, loop_end):
-                    loop_face_ids[loop_index] = face_id
+        starts, lengths, ids = _clipped_group_spans(groups, face_ids, face_count)
+        face_indices = _expand_spans(starts, lengths)
+        poly_loop_start, poly_loop_total = poly_loops or _read_poly_loops(mesh)
+        loop_totals = poly_loop_total[face_indices]
+        loop_indices = _expand_spans(poly_loop_start[face_indices], loop_totals)
+        loop_face_ids[loop_indices] = np.repeat(np.repeat(ids, lengths), loop_totals)
     else:
-        for group_idx in range(group_count):
-            start = int(groups[group_idx * 2])
-            count = int(groups[group_idx * 2 + 1])
-            if count <= 0 or start < 0:
-                continue
-            end = min(start + count, loop_count)
-            face_id = int(face_ids[group_idx])
-            for loop_index in range(start, end):
-                loop_face_ids[loop_index] = face_id
+        starts, lengths, ids = _clipped_group_spans(groups, face_ids, loop_count)
+        loop_face_ids[_expand_spans(starts, lengths)] = np.repeat(ids, lengths)
 
     return loop_face_ids
 
 
-def _normalize_loop_face_ids(mesh, loop_face_ids):
-    if not loop_face_ids:
-        return
-    for poly in mesh.polygons:
-        loop_start = poly.loop_start
-        loop_end = loop_start + poly.loop_total
-        counts = {}
-        for loop_index in range(loop_start, loop_end):
-            face_id = loop_face_ids[loop_index]
-            if face_id is None or face_id < 0:
-                continue
-            counts[face_id] = counts.get(face_id, 0) + 1
-        if not counts:
-            continue
-        dominant_id = max(counts.items(), key=lambda item: item[1])[0]
-        for loop_index in range(loop_start, loop_end):
-            loop_face_ids[loop_index] = dominant_id
+def _normalize_loop_face_ids(mesh, loop_face_ids, poly_loops=None):
+    # Give every loop of a polygon the polygon's most frequent face id; ties go
+    # to the id that appears first. Polygons without a valid id are left as is.
+    face_count = len(mesh.polygons)
+    if face_count == 0 or len(loop_face_ids) == 0:
+        return loop_face_ids
+    poly_loop_start, poly_loop_total = poly_loops or _read_poly_loops(mesh)
+    loop_indices = _expand_spans(poly_loop_start, poly_loop_total)
+    poly_indices = np.repeat(np.arange(face_count, dtype=np.int64), poly_loop_total)
+    ids = loop_face_ids[loop_indices]
+
+    valid = ids >= 0
+    if not valid.any():
+        return loop_face_ids
+    positions = np.flatnonzero(valid)
+    valid_polys = poly_indices[valid]
+    valid_ids = ids[valid]
+
+    order = np.lexsort((valid_ids, valid_polys))
+    sorted_polys = valid_polys[order]
+    sorted_ids = valid_ids[order]
+    run_start = np.ones(len(order), dtype=bool)
+    run_start[1:] = (sorted_polys[1:] != sorted_polys[:-1]) | (sorted_ids[1:] != sorted_ids[:-1])
+    run_starts = np.flatnonzero(run_start)
+    run_counts = np.diff(np.append(run_starts, len(order)))
+    run_first = np.minimum.reduceat(positions[order], run_starts)
+    run_polys = sorted_polys[run_starts]
+
+    best = np.lexsort((run_first, -run_counts, run_polys))
+    best_polys = run_polys[best]
+    first_of_poly = np.ones(len(best), dtype=bool)
+    first_of_poly[1:] = best_polys[1:] != best_polys[:-1]
+    dominant = np.full(face_count, -1, dtype=loop_face_ids.dtype)
+    has_dominant = np.zeros(face_count, dtype=bool)
+    winners = best[first_of_poly]
+    dominant[run_polys[winners]] = sorted_ids[run_starts[winners]]
+    has_dominant[run_polys[winners]] = True
+
+    update = has_dominant[poly_indices]
+    loop_face_ids[loop_indices[update]] = dominant[poly_indices[update]]
+    return loop_face_ids
 
 
 def _compress_loop_face_ids(loop_face_ids):
-    groups_out = []
-    face_ids_out = []
-    current_id = None
-    start = 0
-    count = 0
-    for loop_index, face_id in enumerate(loop_face_ids):
-        if face_id is None or face_id < 0:
-            if current_id is not None:
-                groups_out.extend([start, count])
-                face_ids_out.append(current_id)
-                current_id = None
-                count = 0
-            continue
-        if current_id is None:
-            current_id = face_id
-            start = loop_index
-            count = 1
-        elif face_id == current_id:
-            count += 1
-        else:
-            groups_out.extend([start, count])
-            face_ids_out.append(current_id)
-            current_id = face_id
-            start = loop_index
-            count = 1
-
-    if current_id is not None:
-        groups_out.extend([start, count])
-        face_ids_out.append(current_id)
-
-    return groups_out, face_ids_out
+    ids = np.asarray(loop_face_ids)
+    if ids.size == 0:
+        return [], []
+    # Negative ids never form a group, so collapse them to one value that
+    # still breaks the surrounding runs.
+    ids = np.where(ids < 0, -1, ids)
+    change = np.empty(ids.size + 1, dtype=bool)
+    change[0] = True
+    change[-1] = True
+    np.not_equal(ids[1:], ids[:-1], out=change[1:-1])
+    bounds = np.flatnonzero(change)
+    starts = bounds[:-1]
+    counts = np.diff(bounds)
+    run_ids = ids[starts]
+    keep = run_ids >= 0
+    groups_out = np.stack((starts[keep], counts[keep]), axis=1).ravel()
+    return groups_out, run_ids[keep]
 
 
 def _ensure_loop_index_attribute(mesh, indices):
@@ -1624,9 +1704,9 @@ def _ensure_loop_index_attribute(mesh, indices):
     return _PLASTICITY_LOOP_INDEX_ATTR
 
 
-def _ensure_face_id_attribute(mesh, groups, face_ids):
-    loop_face_ids = _build_loop_face_ids(mesh, groups, face_ids)
-    if not loop_face_ids:
+def _ensure_face_id_attribute(mesh, groups, face_ids, poly_loops=None):
+    loop_face_ids = _build_loop_face_ids(mesh, groups, face_ids, poly_loops)
+    if loop_face_ids is None:
         return None
     if _PLASTICITY_FACE_ID_ATTR in mesh.attributes:
         mesh.attributes.remove(mesh.attributes[_PLASTICITY_FACE_ID_ATTR])
@@ -1635,7 +1715,7 @@ def _ensure_face_id_attribute(mesh, groups, face_ids):
     return _PLASTICITY_FACE_ID_ATTR
 
 
-def _rebuild_groups_from_face_id_attribute(mesh, attr_name):
+def _rebuild_groups_from_face_id_attribute(mesh, attr_name, poly_loops=None):
     attr = mesh.attributes.get(attr_name)
     if not attr:
         return [], []
@@ -1644,8 +1724,7 @@ def _rebuild_groups_from_face_id_attribute(mesh, attr_name):
         return [], []
     loop_face_ids = np.empty(loop_count, dtype=np.int32)
     attr.data.foreach_get("value", loop_face_ids)
-    loop_face_ids = loop_face_ids.tolist()
-    _normalize_loop_face_ids(mesh, loop_face_ids)
+    loop_face_ids = _normalize_loop_face_ids(mesh, loop_face_ids, poly_loops)
     return _compress_loop_face_ids(loop_face_ids)
 
 
@@ -1658,15 +1737,29 @@ def _cleanup_temp_attributes(mesh, attr_names):
             mesh.attributes.remove(attr)
 
 
-def _apply_plasticity_groups_and_normals(mesh, indices, normals, groups, face_ids):
-    face_attr = _ensure_face_id_attribute(mesh, groups, face_ids)
+def _apply_plasticity_groups_and_normals(mesh, indices, normals, groups, face_ids, poly_loops=None):
+    # poly_loops is the (loop_start, loop_total) pair the caller just wrote, if
+    # known; it is read back from the mesh at most once otherwise.
+    if poly_loops is None and len(groups) and len(face_ids):
+        poly_loops = _read_poly_loops(mesh)
+    face_attr = _ensure_face_id_attribute(mesh, groups, face_ids, poly_loops)
     loop_index_attr = None
-    if face_attr:
+    if face_attr or normals is not None:
+        # Carries each corner's source vertex index through mesh.validate().
         loop_index_attr = _ensure_loop_index_attribute(mesh, indices)
-        mesh.validate(clean_customdata=False)
+    if face_attr:
+        if mesh.validate(clean_customdata=False):
+            poly_loops = None
         groups, face_ids = _rebuild_groups_from_face_id_attribute(
-            mesh, face_attr)
-
+            mesh, face_attr, poly_loops)
+
+    # NOTE: As of blender 4.2, the concrete type of user attributes cannot be numpy arrays.
+    if isinstance(groups, np.ndarray):
+        groups = groups.tolist()
+    if isinstance(face_ids, np.ndarray):
+        face_ids = face_ids.tolist()
+    assert isinstance(groups, list)
+    assert isinstance(face_ids, list)
     mesh["groups"] = groups
     mesh["face_ids"] = face_ids
     mesh["plasticity_groups_version"] = int(mesh.get("plasticity_groups_version", 0)) + 1
@@ -1680,7 +1773,9 @@ def safe_loop_normals(mesh, indices, normals):
         mesh.attributes.remove(mesh.attributes["temp_custom_normals"])
     if normals is None or len(mesh.loops) == 0:
         return
-    normals_array = normals.reshape(-1, 3)
+    normals_array = np.ascontiguousarray(normals, dtype=np.float32).reshape(-1, 3)
+
+    mesh.validate(clean_customdata=False)
     loop_count = len(mesh.loops)
 
     loop_indices = None
@@ -1694,18 +1789,10 @@ def safe_loop_normals(mesh, indices, normals):
         loop_indices = np.empty(loop_count, dtype=np.int32)
         mesh.loops.foreach_get("vertex_index", loop_indices)
 
-    mesh.attributes.new("temp_custom_normals", 'FLOAT_VECTOR', 'CORNER')
-    mesh.attributes["temp_custom_normals"].data.foreach_set(
-        "vector", normals_array[loop_indices].ravel())
-
-    mesh.validate(clean_customdata=False)
-
-    buf = np.empty(len(mesh.loops) * 3, dtype=np.float32)
-    mesh.attributes["temp_custom_normals"].data.foreach_get("vector", buf)
+    loop_normals = normals_array[loop_indices]
 
-    mesh.polygons.foreach_set("use_smooth", [True] * len(mesh.polygons))
+    mesh.polygons.foreach_set("use_smooth", _smooth_flags(len(mesh.polygons)))
 
-    mesh.normals_split_custom_set(buf.reshape(-1, 3))
-    mesh.attributes.remove(mesh.attributes["temp_custom_normals"])
+    mesh.normals_split_custom_set(loop_normals)
 
     mesh.update()
@@ -2,6 +2,7 @@ import math
 import mathutils
 import os
 import colorsys
+import functools
 import re
 import time
 import zlib
@@ -10,6 +11,7 @@ import bmesh
 import bpy
 import bpy.utils.previews
 import gpu
+import numpy as np
 from bpy_extras import view3d_utils
 from gpu_extras.batch import batch_for_shader
 
@@ -18,6 +20,9 @@ _CHECKER_PREVIEWS = None
 _CHECKER_ENUM_MAP = {}
 _CHECKER_ENUM_ID_MAX = 63
 _CHECKER_FILES_CACHE = None
+_CHECKER_LISTING_CACHE = None
+_CHECKER_ENUM_UNSAFE_RE = re.compile(r'[^A-Za-z0-9_]')
+_CHECKER_IMAGE_EXTS = frozenset((".png", ".jpg", ".jpeg", ".tga", ".tif", ".tiff", ".bmp", ".exr"))
 RELAX_LAYER_NAME = "plasticity_relaxed"
 RELAX_STATE_KEY = "plasticity_relax_state"
 FACE_MATERIAL_MAP_KEY = "plasticity_face_material_map"
@@ -30,6 +35,8 @@ _UNWRAP_METHOD_TO_ID = {
     "MINIMUM_STRETCH": 3,
 }
 _UNWRAP_ID_TO_METHOD = {value: key for key, value in _UNWRAP_METHOD_TO_ID.items()}
+_UNWRAP_PROP_TYPES = frozenset(("BOOLEAN", "INT", "FLOAT", "ENUM"))
+_UNWRAP_PROP_DEFAULTS = None
 
 
 def _checker_images_dir():
@@ -37,16 +44,30 @@ def _checker_images_dir():
 
 
 def _list_checker_images():
+    # Called from enum item callbacks on every redraw; only rescan the folder
+    # when its mtime changes.
+    global _CHECKER_LISTING_CACHE
     images_dir = _checker_images_dir()
-    if not os.path.isdir(images_dir):
-        return []
-    exts = {".png", ".jpg", ".jpeg", ".tga", ".tif", ".tiff", ".bmp", ".exr"}
-    files = []
-    for name in os.listdir(images_dir):
-        ext = os.path.splitext(name)[1].lower()
-        if ext in exts:
-            files.append(name)
-    files.sort()
+    try:
+        mtime = os.stat(images_dir).st_mtime_ns
+    except OSError:
+        _CHECKER_LISTING_CACHE = None
+        return ()
+    if _CHECKER_LISTING_CACHE is not None and _CHECKER_LISTING_CACHE[0] == mtime:
+        return _CHECKER_LISTING_CACHE[1]
+    names = []
+    try:
+        with os.scandir(images_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if os.path.splitext(name)[1].lower() not in _CHECKER_IMAGE_EXTS:
+                    continue
+                if entry.is_file():
+                    names.append(name)
+    except OSError:
+        return ()
+    files = tuple(sorted(names))
+    _CHECKER_LISTING_CACHE = (mtime, files)
     return files
 
 
@@ -57,9 +78,10 @@ def _ensure_checker_previews():
     return _CHECKER_PREVIEWS
 
 
+@functools.lru_cache(maxsize=512)
 def _checker_enum_id(filename):
     base = os.path.splitext(filename)[0]
-    safe = re.sub(r'[^A-Za-z0-9_]', '_', base.upper())
+    safe = _CHECKER_ENUM_UNSAFE_RE.sub('_', base.upper())
     if not safe or safe[0].isdigit():
         safe = f"IMG_{safe}"
     checksum = zlib.crc32(filename.encode("utf-8")) & 0xFFFFFFFF
@@ -119,7 +141,7 @@ def get_checker_image_items(self, context):
     global _CHECKER_FILES_CACHE
     if _CHECKER_FILES_CACHE != files:
         clear_checker_previews()
-        _CHECKER_FILES_CACHE = files[:]
+        _CHECKER_FILES_CACHE = files
 
     pcoll = None
     try:
@@ -133,22 +155,38 @@ def get_checker_image_items(self, context):
         except Exception:
             pcoll = None
 
+    if pcoll is None:
+        items.extend(_checker_items_no_preview(files, images_dir))
+    else:
+        items.extend(_checker_items_with_preview(files, images_dir, pcoll))
+    return items
+
+
+def _checker_items_no_preview(files, images_dir):
+    enum_map = _CHECKER_ENUM_MAP
+    items = []
     for idx, filename in enumerate(files, start=1):
-        try:
-            enum_id = _checker_enum_id(filename)
-            _CHECKER_ENUM_MAP[enum_id] = filename
-            filepath = os.path.join(images_dir, filename)
-            icon_id = 0
-            if pcoll is not None:
-                try:
-                    if filename not in pcoll:
-                        pcoll.load(filename, filepath, 'IMAGE')
-                    icon_id = pcoll[filename].icon_id
-                except Exception:
-                    icon_id = 0
-            items.append((enum_id, filename, filepath, icon_id, idx))
-        except Exception:
-            continue
+        enum_id = _checker_enum_id(filename)
+        enum_map[enum_id] = filename
+        items.append((enum_id, filename, os.path.join(images_dir, filename), 0, idx))
+    return items
+
+
+def _checker_items_with_preview(files, images_dir, pcoll):
+    enum_map = _CHECKER_ENUM_MAP
+    items = []
+    for idx, filename in enumerate(files, start=1):
+        enum_id = _checker_enum_id(filename)
+        enum_map[enum_id] = filename
+        filepath = os.path.join(images_dir, filename)
+        preview = pcoll.get(filename)
+        if preview is None:
+            try:
+                preview = pcoll.load(filename, filepath, 'IMAGE')
+            except Exception:
+                preview = None
+        icon_id = preview.icon_id if preview is not None else 0
+        items.append((enum_id, filename, filepath, icon_id, idx))
     return items
 
 
@@ -419,21 +457,28 @@ class MergeUVSeams(bpy.types.Operator):
         def expand_selection_by_seams(bm, seed_faces):
             if not seed_faces:
                 return set()
-            bm.faces.ensure_lookup_table()
-            bm.edges.ensure_lookup_table()
-            expanded = {idx for idx in seed_faces if idx < len(bm.faces)}
-            stack = list(expanded)
+            # The caller ensures the face lookup table right after from_edit_mesh.
+            faces = bm.faces
+            face_count = len(faces)
+            # Byte-per-face bitmap instead of a set of ints for the visited test.
+            expanded = bytearray(face_count)
+            reached = [idx for idx in seed_faces if idx < face_count]
+            for idx in reached:
+                expanded[idx] = 1
+            # Walk faces directly instead of indices to skip a table lookup per face.
+            stack = [faces[idx] for idx in reached]
             while stack:
-                face = bm.faces[stack.pop()]
-                for edge in face.edges:
+                for edge in stack.pop().edges:
                     if edge.seam:
                         continue
                     for linked in edge.link_faces:
-                        if linked.index in expanded:
+                        index = linked.index
+                        if expanded[index]:
                             continue
-                        expanded.add(linked.index)
-                        stack.append(linked.index)
-            return expanded
+                        expanded[index] = 1
+                        reached.append(index)
+                        stack.append(linked)
+            return set(reached)
 
         edit_objects = getattr(context, "objects_in_mode", None)
         if not edit_objects:
@@ -447,14 +492,19 @@ class MergeUVSeams(bpy.types.Operator):
             self.report({'WARNING'}, "Select faces to merge UV seams")
             return {'CANCELLED'}
 
+        scene = context.scene
+        view_layer = context.view_layer
         occluded_only = bool(
-            getattr(context.scene, "prop_plasticity_auto_cylinder_seam_occluded_only", False)
+            getattr(scene, "prop_plasticity_auto_cylinder_seam_occluded_only", False)
         )
-        view_context = _find_view3d_region(context.scene) if occluded_only else None
+        view_context = _find_view3d_region(scene) if occluded_only else None
         seam_mode = str(
-            getattr(context.scene, "prop_plasticity_auto_seam_mode", "CYLINDER")
+            getattr(scene, "prop_plasticity_auto_seam_mode", "CYLINDER")
         )
-        prev_active = context.view_layer.objects.active
+        if seam_mode == 'CYLINDER':
+            cylinder_mode = str(scene.prop_plasticity_auto_cylinder_seam_mode)
+            cylinder_angle = float(scene.prop_plasticity_auto_cylinder_partial_angle)
+        prev_active = view_layer.objects.active
         any_processed = False
 
         prev_suppress = _LIVE_EXPAND_SUPPRESS_AUTO_MERGE
@@ -467,13 +517,16 @@ class MergeUVSeams(bpy.types.Operator):
             for obj in edit_objects:
                 mesh = obj.data
                 bm = bmesh.from_edit_mesh(mesh)
+                # Topology is not edited below, so the face table stays valid
+                # for the rest of this object's pass.
                 bm.faces.ensure_lookup_table()
-                original_selected = {face.index for face in bm.faces if face.select}
+                faces = bm.faces[:]
+                original_selected = {face.index for face in faces if face.select}
                 if not original_selected:
                     continue
 
                 expanded_faces = expand_selection_by_seams(bm, original_selected)
-                for face in bm.faces:
+                for face in faces:
                     face.select = face.index in expanded_faces
 
                 changed_to_true, changed_to_false = _auto_merge_seams_on_selection(
@@ -487,11 +540,11 @@ class MergeUVSeams(bpy.types.Operator):
                     cylinder_changed = _auto_cylinder_seam_on_selection(
                         bm,
                         expanded_faces,
-                        mode=str(context.scene.prop_plasticity_auto_cylinder_seam_mode),
-                        partial_angle=float(context.scene.prop_plasticity_auto_cylinder_partial_angle),
+                        mode=cylinder_mode,
+                        partial_angle=cylinder_angle,
                         occluded_only=occluded_only,
                         obj=obj,
-                        scene=context.scene,
+                        scene=scene,
                         view_context=view_context,
                     )
                     if cylinder_changed:
@@ -505,7 +558,7 @@ class MergeUVSeams(bpy.types.Operator):
                     if sphere_changed:
                         changed_to_true.extend(sphere_changed)
 
-                for face in bm.faces:
+                for face in faces:
                     face.select = face.index in original_selected
 
                 did_merge = bool(changed_to_true or changed_to_false) or sphere_projected
@@ -513,8 +566,8 @@ class MergeUVSeams(bpy.types.Operator):
                     any_processed = True
                     _touch_seams_version(mesh)
                     bmesh.update_edit_mesh(mesh, loop_triangles=True, destructive=False)
-                    if context.view_layer.objects.active != obj:
-                        context.view_layer.objects.active = obj
+                    if view_layer.objects.active != obj:
+                        view_layer.objects.active = obj
                     # In multi-object edit mode, a single deferred unwrap can
                     # update only one active object visually. Run per-object
                     # unwrap + fallback so each changed object refreshes live.
@@ -536,7 +589,7 @@ class MergeUVSeams(bpy.types.Operator):
                 _invalidate_live_expand_overlay_cache()
 
             if prev_active is not None:
-                context.view_layer.objects.active = prev_active
+                view_layer.objects.active = prev_active
 
             if not any_processed:
                 self.report({'WARNING'}, "Select faces to merge UV seams")
@@ -612,9 +665,23 @@ def _relax_uv_edge_linked(loop, uv_layer):
     )
 
 
-def _relax_linked_uv_loops(loop, uv_layer):
+def _relax_linked_uv_loops(loop, uv_layer, vert_buckets=None):
     uv = loop[uv_layer].uv
-    return [l for l in loop.vert.link_loops if l[uv_layer].uv == uv]
+    if vert_buckets is None:
+        return [l for l in loop.vert.link_loops if l[uv_layer].uv == uv]
+    # Callers walking many loops pass a dict so each vertex scans its loops
+    # once per distinct UV rather than once per loop. The exact UV is only
+    # the memo key; matching still uses Vector == like the uncached path.
+    vert = loop.vert
+    buckets = vert_buckets.get(vert)
+    if buckets is None:
+        buckets = vert_buckets[vert] = {}
+    key = (uv[0], uv[1])
+    linked = buckets.get(key)
+    if linked is None:
+        linked = [l for l in vert.link_loops if l[uv_layer].uv == uv]
+        buckets[key] = linked
+    return linked
 
 
 def _relax_is_boundary(loop, uv_layer, face_selected_fn):
@@ -623,60 +690,81 @@ def _relax_is_boundary(loop, uv_layer, face_selected_fn):
         return True
     if not face_selected_fn(other.face):
         return True
-    return (
-        loop[uv_layer].uv.to_tuple() != other.link_loop_next[uv_layer].uv.to_tuple()
-        or loop.link_loop_next[uv_layer].uv.to_tuple() != other[uv_layer].uv.to_tuple()
-    )
+    ua, va = loop[uv_layer].uv
+    ub, vb = other.link_loop_next[uv_layer].uv
+    uc, vc = loop.link_loop_next[uv_layer].uv
+    ud, vd = other[uv_layer].uv
+    return ua != ub or va != vb or uc != ud or vc != vd
 
 
 def _relax_collect_islands(faces, uv_layer):
-    face_set = set(faces)
+    faces_by_idx = {face.index: face for face in faces}
+    if not faces_by_idx:
+        return []
+    size = max(faces_by_idx) + 1
+    in_set = bytearray(size)
+    for idx in faces_by_idx:
+        in_set[idx] = 1
+    visited = bytearray(size)
     islands = []
-    visited = set()
 
-    for face in face_set:
-        if face in visited:
+    for start in faces_by_idx:
+        if visited[start]:
             continue
-        stack = [face]
+        stack = [start]
         island = []
         while stack:
             current = stack.pop()
-            if current in visited:
+            if visited[current]:
                 continue
-            visited.add(current)
-            island.append(current)
+            visited[current] = 1
+            face = faces_by_idx[current]
+            island.append(face)
 
-            for loop in current.loops:
+            for loop in face.loops:
                 other = loop.link_loop_radial_prev
                 if other == loop:
                     continue
-                if other.face not in face_set:
+                other_idx = other.face.index
+                if other_idx >= size or not in_set[other_idx]:
                     continue
                 if loop.edge.seam:
                     continue
                 if not _relax_uv_edge_linked(loop, uv_layer):
                     continue
-                stack.append(other.face)
+                stack.append(other_idx)
 
         islands.append(island)
     return islands
 
 
+_RELAX_EXACT_ANCHOR_MAX = 512
+
+
 def _relax_pick_anchor_loops(loops, uv_layer):
-    if len(loops) < 2:
+    count = len(loops)
+    if count < 2:
         return None, None
-    max_dist = -1.0
-    anchor_a = None
-    anchor_b = None
-    coords = [loop[uv_layer].uv.copy() for loop in loops]
-    for i, co_a in enumerate(coords):
-        for j in range(i + 1, len(coords)):
-            dist = (co_a - coords[j]).length_squared
-            if dist > max_dist:
-                max_dist = dist
-                anchor_a = loops[i]
-                anchor_b = loops[j]
-    return anchor_a, anchor_b
+    coords = np.fromiter(
+        (value for loop in loops for value in loop[uv_layer].uv),
+        dtype=np.float64,
+        count=count * 2,
+    ).reshape(-1, 2)
+    if count <= _RELAX_EXACT_ANCHOR_MAX:
+        # Exact farthest pair; argmax over the upper triangle keeps the first
+        # (i, j) pair on ties, like the original nested loop.
+        deltas = coords[:, None, :] - coords[None, :, :]
+        dist = np.einsum("ijk,ijk->ij", deltas, deltas)
+        dist[np.tril_indices(count)] = -1.0
+        i, j = divmod(int(dist.argmax()), count)
+    else:
+        # Large islands: farthest point from an arbitrary start, then farthest
+        # from that. Good enough for anchoring the relax transform.
+        i = int(((coords - coords[0]) ** 2).sum(axis=1).argmax())
+        j = int(((coords - coords[i]) ** 2).sum(axis=1).argmax())
+        if i == j:
+            j = 1 if i == 0 else 0
+    return loops[i], loops[j]
 
 
 class _RelaxIslandTransform:
@@ -708,21 +796,31 @@ class _RelaxIslandTransform:
         angle = math.atan2(v0.y, v0.x) - math.atan2(v1.y, v1.x)
         cos_a = math.cos(angle)
         sin_a = math.sin(angle)
-        for loop in self.loops:
-            uv = loop[self.uv_layer].uv
-            rel = uv - a1
-            new_x = rel.x * cos_a - rel.y * sin_a
-            new_y = rel.x * sin_a + rel.y * cos_a
-            uv[:] = (new_x * scale + self.a0.x, new_y * scale + self.a0.y)
+        uv_layer = self.uv_layer
+        uvs = [loop[uv_layer].uv for loop in self.loops]
+        coords = np.fromiter(
+            (value for uv in uvs for value in uv),
+            dtype=np.float64,
+            count=len(uvs) * 2,
+        ).reshape(-1, 2)
+        transform = scale * np.array(((cos_a, -sin_a), (sin_a, cos_a)))
+        coords = (coords - (a1.x, a1.y)) @ transform.T + (self.a0.x, self.a0.y)
+        for uv, new_uv in zip(uvs, coords.tolist()):
+            uv[:] = new_uv
 
 
 def _relax_any_uv_selected(bm, uv_layer):
+    # Resolve which UV selection API this Blender has once, not per loop.
+    if hasattr(bmesh.types.BMLoop, "uv_select_vert"):
+        return any(
+            loop.uv_select_vert or loop.uv_select_edge
+            for face in bm.faces
+            for loop in face.loops
+        )
     for face in bm.faces:
         for loop in face.loops:
-            if (
-                _relax_uv_loop_vert_selected(loop, uv_layer)
-                or _relax_uv_loop_edge_selected(loop, uv_layer)
-            ):
+            loop_uv = loop[uv_layer]
+            if loop_uv.select or loop_uv.select_edge:
                 return True
     return False
 
@@ -988,16 +1086,7 @@ def _snapshot_unwrap_last_props(context):
     if props is None:
         return None
     values = {}
-    try:
-        rna_props = props.bl_rna.properties
-    except Exception:
-        return None
-    for prop in rna_props:
-        if prop.is_readonly:
-            continue
-        if prop.type not in {"BOOLEAN", "INT", "FLOAT", "ENUM"}:
-            continue
-        name = prop.identifier
+    for name in _unwrap_prop_defaults():
         if not hasattr(props, name):
             continue
         try:
@@ -1027,19 +1116,25 @@ def _restore_unwrap_last_props(context, values):
                 pass
 
 
+def _unwrap_prop_defaults():
+    # The uv.unwrap RNA definition is fixed for the session; introspect it once.
+    global _UNWRAP_PROP_DEFAULTS
+    if _UNWRAP_PROP_DEFAULTS is None:
+        try:
+            rna_props = bpy.ops.uv.unwrap.get_rna_type().properties
+        except Exception:
+            return {}
+        _UNWRAP_PROP_DEFAULTS = {
+            prop.identifier: prop.default
+            for prop in rna_props
+            if not prop.is_readonly and prop.type in _UNWRAP_PROP_TYPES
+        }
+    return _UNWRAP_PROP_DEFAULTS
+
+
 def _default_unwrap_props():
-    try:
-        rna_props = bpy.ops.uv.unwrap.get_rna_type().properties
-    except Exception:
-        return None
-    defaults = {}
-    for prop in rna_props:
-        if prop.is_readonly:
-            continue
-        if prop.type not in {"BOOLEAN", "INT", "FLOAT", "ENUM"}:
-            continue
-        defaults[prop.identifier] = prop.default
-    return defaults or None
+    defaults = _unwrap_prop_defaults()
+    return dict(defaults) if defaults else None
 
 
 def _unwrap_kwargs_from_last_props(context):
@@ -1823,6 +1918,7 @@ class RelaxUVsPlasticityOperator(bpy.types.Operator):
 
         faces_to_select = set()
         border_loops = set()
+        vert_buckets = {}
         for face in selected_faces:
             for loop in face.loops:
                 other = loop.link_loop_radial_prev
@@ -1839,7 +1935,9 @@ class RelaxUVsPlasticityOperator(bpy.types.Operator):
                     elif not _relax_uv_edge_linked(loop, uv_layer):
                         is_border = True
                 if is_border:
-                    border_loops.update(_relax_linked_uv_loops(loop, uv_layer))
+                    border_loops.update(
+                        _relax_linked_uv_loops(loop, uv_layer, vert_buckets)
+                    )
 
         for face in faces_to_select:
             face.select = True
@@ -1854,13 +1952,14 @@ class RelaxUVsPlasticityOperator(bpy.types.Operator):
             return [], []
 
         border_loops = set()
+        vert_buckets = {}
         for face in selected_faces:
             for loop in face.loops:
                 if not _relax_uv_loop_selected(loop, uv_layer, mode):
                     continue
                 if _relax_is_boundary(loop, uv_layer, face_selected):
                     border_loops.add(loop)
-                    for linked in _relax_linked_uv_loops(loop, uv_layer):
+                    for linked in _relax_linked_uv_loops(loop, uv_layer, vert_buckets):
                         if face_selected(linked.face):
                             border_loops.add(linked)
         return selected_faces, list(border_loops)
@@ -1911,6 +2010,8 @@ class RelaxUVsPlasticityOperator(bpy.types.Operator):
             bm.verts.ensure_lookup_table()
             bm.edges.ensure_lookup_table()
             bm.faces.ensure_lookup_table()
+            # Island collection keys faces by index, so make sure they are current.
+            bm.faces.index_update()
 
             selection, uv_selection = self._snapshot_selection(bm, uv_layer, uv_sync)
 
@@ -3384,6 +3485,13 @@ def _build_face_id_map(groups, face_ids, mesh):
 _PLASTICITY_GROUP_CACHE = {}
 
 
+def clear_operator_caches():
+    global _CHECKER_LISTING_CACHE
+    _PLASTICITY_GROUP_CACHE.clear()
+    _CHECKER_ENUM_MAP.clear()
+    _CHECKER_LISTING_CACHE = None
+
+
 def _get_group_cache_key(mesh):
     try:
         return mesh.as_pointer()
@@ -3732,7 +3840,7 @@ _PAINT_PREVIEW_MATERIAL_NAME = "PlasticityFaceColorPreview"
 
 def _is_live_link_active():
     try:
-        from .__init__ import plasticity_client
+        from . import plasticity_client
     except Exception:
         return False
     try:
@@ -4021,6 +4129,8 @@ def _run_refacet_with_target_override(context, selected_targets):
 def _build_refacet_settings_signature(context):
     if context is None:
         return None
+    from . import _ensure_presets_loaded
+    _ensure_presets_loaded()
     scene = context.scene
     if scene is None:
         return None
@@ -9420,13 +9530,22 @@ class RemoveUVCheckerNodesOperator(bpy.types.Operator):
             return 0
 
         fallback_index = 0
-        for poly in mesh.polygons:
-            old_idx = int(poly.material_index)
-            new_idx = keep_old_to_new.get(old_idx)
-            if new_idx is None:
-                new_idx = fallback_index
-            if poly.material_index != new_idx:
-                poly.material_index = new_idx
+        poly_count = len(mesh.polygons)
+        if poly_count:
+            # Remap every polygon's slot in one pass; removed or out-of-range
+            # slots fall back to the first kept material.
+            remap = np.full(len(old_materials), fallback_index, dtype=np.int32)
+            for old_idx, new_idx in keep_old_to_new.items():
+                remap[old_idx] = new_idx
+            material_indices = np.empty(poly_count, dtype=np.int32)
+            mesh.polygons.foreach_get("material_index", material_indices)
+            in_range = (material_indices >= 0) & (material_indices < len(old_materials))
+            material_indices = np.where(
+                in_range,
+                remap[np.clip(material_indices, 0, len(old_materials) - 1)],
+                fallback_index,
+            ).astype(np.int32, copy=False)
+            mesh.polygons.foreach_set("material_index", material_indices)
 
         mesh.materials.clear()
         for material in kept_materials:
@@ -2,8 +2,8 @@
 import math
 import os
 
-from .__init__ import plasticity_client
-from .__init__ import load_presets
+from . import plasticity_client
+from . import load_presets, _ensure_presets_loaded
 from .client import FacetShapeType, MessageType
 
 
@@ -273,6 +273,7 @@ class ConnectButton(bpy.types.Operator):
         
         # Load the refacet presets after connecting (not ideal, but works for now).
         load_presets(context.scene)
+        _ensure_presets_loaded()
         
         return {'FINISHED'}
 
@@ -414,6 +415,7 @@ class RefacetButton(bpy.types.Operator):
 
         context.window_manager.plasticity_busy = True
 
+        _ensure_presets_loaded()
         if len(context.scene.refacet_presets) > 0:
             preset = context.scene.refacet_presets[context.scene.active_refacet_preset_index]
 
@@ -550,16 +552,17 @@ class PlasticityPanel(bpy.types.Panel):
             split = tabs_row.split(factor=0.1)
             tabs_col = split.column(align=True)
             layout = split.column()
+            window_manager = context.window_manager
 
-            tabs_col.prop_enum(scene, "prop_plasticity_ui_tab", "PINNED", text="", icon="PINNED")
-            tabs_col.prop_enum(scene, "prop_plasticity_ui_tab", "MAIN", text="", icon="LINKED")
-            tabs_col.prop_enum(scene, "prop_plasticity_ui_tab", "REFACET", text="", icon="MOD_REMESH")
-            tabs_col.prop_enum(scene, "prop_plasticity_ui_tab", "UTILITIES", text="", icon="TOOL_SETTINGS")
-            tabs_col.prop_enum(scene, "prop_plasticity_ui_tab", "UV_TOOLS", text="", icon="UV")
-            tabs_col.prop_enum(scene, "prop_plasticity_ui_tab", "MESH_TOOLS", text="", icon="MESH_CUBE")
-            tabs_col.prop_enum(scene, "prop_plasticity_ui_tab", "PREFERENCES", text="", icon="PREFERENCES")
+            tabs_col.prop_enum(window_manager, "prop_plasticity_ui_tab", "PINNED", text="", icon="PINNED")
+            tabs_col.prop_enum(window_manager, "prop_plasticity_ui_tab", "MAIN", text="", icon="LINKED")
+            tabs_col.prop_enum(window_manager, "prop_plasticity_ui_tab", "REFACET", text="", icon="MOD_REMESH")
+            tabs_col.prop_enum(window_manager, "prop_plasticity_ui_tab", "UTILITIES", text="", icon="TOOL_SETTINGS")
+            tabs_col.prop_enum(window_manager, "prop_plasticity_ui_tab", "UV_TOOLS", text="", icon="UV")
+            tabs_col.prop_enum(window_manager, "prop_plasticity_ui_tab", "MESH_TOOLS", text="", icon="MESH_CUBE")
+            tabs_col.prop_enum(window_manager, "prop_plasticity_ui_tab", "PREFERENCES", text="", icon="PREFERENCES")
 
-            active_tab = scene.prop_plasticity_ui_tab
+            active_tab = window_manager.prop_plasticity_ui_tab
             tab_labels = {
                 "PINNED": "Pinned",
                 "MAIN": "Main",
@@ -1119,6 +1122,7 @@ class PlasticityPanel(bpy.types.Panel):
                         live_col.prop(scene, "prop_plasticity_live_refacet_interval", text="Update Interval")
                 col.label(text="Refacet Presets")
 
+                _ensure_presets_loaded()
                 row = col.row()
                 row.template_list("OBJECT_UL_RefacetPresetsList", "refacet_presets", context.scene, "refacet_presets", context.scene, "active_refacet_preset_index")
 